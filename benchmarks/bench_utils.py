@@ -0,0 +1,110 @@
+"""
+Micro-benchmarks for the helpers in `tadatakit.class_generator.utils`.
+
+Each benchmark has a `setup` function building typical inputs and a `run` function calling only the helper being
+measured, so the time reported is the helper's alone. These are for measuring changes to the helpers, not tests, and
+are run directly:
+
+    poetry run python benchmarks/bench_utils.py
+"""
+
+import timeit
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional, Union
+from uuid import uuid4
+
+from tadatakit.class_generator.utils import (
+    convert_non_json_serializable_types,
+    copy_function,
+    get_type_checker,
+    is_instance,
+    pascal_to_snake,
+    snake_to_pascal,
+)
+
+SIZE = 10_000
+
+
+def setup_identifiers() -> List[str]:
+    # a few hundred distinct names, repeated as they are when the same properties are converted for every object
+    words = ["Procedure", "Step", "Id", "Sample", "Temperature", "Heat", "Flow", "Unit"]
+    names = [a + b + c for a in words for b in words for c in words]
+    return [names[i % len(names)] for i in range(SIZE)]
+
+
+def run_pascal_to_snake(names: List[str]) -> None:
+    special_names_set = set()
+    for name in names:
+        pascal_to_snake(name, special_names_set)
+
+
+def run_snake_to_pascal(names: List[str]) -> None:
+    special_names_set = set()
+    for name in names:
+        snake_to_pascal(name, special_names_set)
+
+
+def setup_serializable() -> List[Any]:
+    start = datetime(2024, 1, 1)
+    values = []
+    for i in range(SIZE // 2):
+        values.append(start + timedelta(seconds=i, microseconds=i))
+        values.append(uuid4())
+    return values
+
+
+def run_serializer(values: List[Any]) -> None:
+    for value in values:
+        convert_non_json_serializable_types(value)
+
+
+def setup_type_checks() -> List[Any]:
+    return [1.5 if i % 3 else None for i in range(SIZE)]
+
+
+def run_is_instance(values: List[Any]) -> None:
+    for value in values:
+        is_instance(value, Optional[Union[float, str]])
+
+
+def run_type_checker(values: List[Any]) -> None:
+    check = get_type_checker(Optional[Union[float, str]])
+    for value in values:
+        check(value)
+
+
+def setup_functions() -> List[Callable]:
+    def function(a, b: int = 5, *args, scale: int = 2, **kwargs) -> str:
+        return f"{a + b}"
+
+    return [function] * SIZE
+
+
+def run_copy_function(functions: List[Callable]) -> None:
+    for function in functions:
+        copy_function(function)
+
+
+BENCHMARKS = [
+    ("pascal_to_snake", setup_identifiers, run_pascal_to_snake),
+    (
+        "snake_to_pascal",
+        lambda: [pascal_to_snake(n, set()) for n in setup_identifiers()],
+        run_snake_to_pascal,
+    ),
+    ("convert_non_json_serializable_types", setup_serializable, run_serializer),
+    ("is_instance", setup_type_checks, run_is_instance),
+    ("get_type_checker", setup_type_checks, run_type_checker),
+    ("copy_function", setup_functions, run_copy_function),
+]
+
+
+def main(number: int = 5, repeat: int = 5) -> None:
+    for name, setup, run in BENCHMARKS:
+        data = setup()
+        best = min(timeit.repeat(lambda: run(data), number=number, repeat=repeat))
+        print(f"{name:<40} {best / number / SIZE * 1e9:8.1f} ns per call")
+
+
+if __name__ == "__main__":
+    main()
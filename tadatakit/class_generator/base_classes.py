@@ -1,20 +1,28 @@
 from abc import ABC
 from datetime import datetime
-from dateutil import parser as dateutil_parser
-from typing import Any, Type, Union, TextIO, Dict
+from typing import Any, Callable, Type, Union, TextIO, Dict, NamedTuple, Optional
 import inspect
-from functools import wraps
+from types import CodeType, FunctionType
+from functools import lru_cache
 import json
 import os
+import weakref
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .utils import (
     type_hint_to_str,
-    is_instance,
+    get_type_checker,
+    get_exact_types,
     snake_to_pascal,
     pascal_to_snake,
     convert_non_json_serializable_types,
     copy_function,
+    parse_datetime,
 )
 
 native_type_mapping = {
@@ -27,6 +35,239 @@ native_type_mapping = {
 }
 
 
+class PropertyDetails(NamedTuple):
+    """
+    Casting and typing details for a single property added to a SchemaObject subclass.
+
+    Attributes:
+        caster (Any): A function or type used to cast input values to the correct type.
+        type_hint (Type): The type hint for the property.
+        default (Any): The default value for the property, or `inspect.Parameter.empty` if it is required.
+    """
+
+    caster: Any
+    type_hint: Type
+    default: Any = inspect.Parameter.empty
+
+
+def _cast_value(name: str, value: Any, caster: Any, expected_type: Type) -> Any:
+    """
+    Casts a value that does not match its expected type, as used by generated SchemaObject constructors.
+
+    Args:
+        name (str): The name of the argument being cast, used in the error message.
+        value (Any): The value to cast.
+        caster (Any): A function or type used to cast the value.
+        expected_type (Type): The type hint the value is expected to match.
+
+    Returns:
+        Any: The cast value.
+
+    Raises:
+        TypeError: If the value cannot be cast.
+    """
+    try:
+        if caster is datetime:
+            return parse_datetime(value)
+        return caster(value)
+    except (ValueError, TypeError) as e:
+        raise TypeError(
+            f"Argument '{name}' must be of type {expected_type} (value:{value}, type:{type(value)})"
+        ) from e
+
+
+def _parse_json(content: Union[str, bytes]) -> Any:
+    """
+    Parses a JSON document, using orjson when it is installed.
+
+    orjson is strict, so documents it rejects but the standard library accepts (e.g. containing `NaN`) are parsed
+    with the standard library instead.
+
+    Args:
+        content (Union[str, bytes]): The JSON document.
+
+    Returns:
+        Any: The parsed document.
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+class _AttributeNames(dict):
+    """
+    Memoizes the attribute names of a SchemaObject subclass for the keys of the dictionaries it is created from.
+
+    Keys are converted with `pascal_to_snake` the first time they are seen, which also records special names in
+    the class' special names set, and looked up afterwards.
+    """
+
+    def __init__(self, special_names_set: set, schema_names: "_SchemaNames"):
+        super().__init__()
+        self.special_names_set = special_names_set
+        self.schema_names = schema_names
+
+    def __missing__(self, key: str) -> str:
+        name = self[key] = pascal_to_snake(key, self.special_names_set)
+        if name in self.special_names_set:
+            # special names are serialized as they are, which may differ from a name memoized before
+            self.schema_names.pop(name, None)
+        return name
+
+
+class _SchemaNames(dict):
+    """
+    Memoizes the keys a SchemaObject subclass serializes its attributes under.
+
+    Attribute names are converted with `snake_to_pascal` the first time they are seen, and looked up afterwards.
+    """
+
+    def __init__(self, special_names_set: set):
+        super().__init__()
+        self.special_names_set = special_names_set
+
+    def __missing__(self, name: str) -> str:
+        key = self[name] = snake_to_pascal(name, self.special_names_set)
+        return key
+
+
+# the undocumented function each documented copy made by `_DocumentedClassMethod` was copied from
+_documented_functions = weakref.WeakKeyDictionary()
+
+
+def _find_class_method_function(cls: type, name: str) -> Optional[FunctionType]:
+    """
+    Finds the function of the classmethod a class has, or inherits, under a name.
+
+    The method is resolved through the class's MRO, so methods overridden by any base class are kept. Methods
+    already documented for a base class resolve to the function they were copied from, so they can be documented
+    for this class instead.
+
+    Args:
+        cls (type): The class to look the method up on.
+        name (str): The name of the method.
+
+    Returns:
+        Optional[FunctionType]: The function, or None if the class has no classmethod of that name.
+    """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            method = klass.__dict__[name]
+            break
+    else:
+        return None
+    if isinstance(method, _DocumentedClassMethod):
+        return method.function
+    elif isinstance(method, classmethod):
+        return _documented_functions.get(method.__func__, method.__func__)
+    return None
+
+
+class _DocumentedClassMethod:
+    """
+    A classmethod whose docstring and return annotation name the SchemaObject subclass it belongs to.
+
+    The documented copy of the function is only made the first time the method is looked up on the class, and then
+    replaces this descriptor on the class holding it, so that generating classes which are never used does not copy
+    functions.
+    """
+
+    def __init__(self, name: str, function: FunctionType):
+        self.name = name
+        self.function = function
+
+    def __get__(self, instance: Any, owner: type) -> Callable:
+        function = copy_function(self.function)
+        function.__annotations__["return"] = owner.__name__
+        if function.__doc__ is not None:
+            function.__doc__ = function.__doc__.replace("SchemaObject", owner.__name__)
+        _documented_functions[function] = self.function
+        method = classmethod(function)
+        # only replace this descriptor on the class holding it, as it is also looked up on subclasses through
+        # `super()`, and writing it onto them would replace their own overrides
+        if owner.__dict__.get(self.name) is self:
+            setattr(owner, self.name, method)
+        return method.__get__(instance, owner)
+
+
+# types of values that are serialized as they are, checked by exact type before the slower isinstance checks
+_PLAIN_VALUE_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def _type_check_condition(
+    name: str, suffix: str, exact_types: frozenset, namespace: Dict[str, Any]
+) -> str:
+    """
+    Generates the condition under which a generated `__init__` casts an argument.
+
+    Arguments that are `None` are never cast. Arguments whose exact type is one of `exact_types` are known to match
+    their type hint, so the full check (`__check{suffix}` in the namespace) is only made for the others.
+
+    Args:
+        name (str): The name of the argument in the generated code.
+        suffix (str): The suffix of the names of the argument's check function and exact types in the namespace.
+        exact_types (frozenset): The classes whose exact instances match the argument's type hint.
+        namespace (Dict[str, Any]): The namespace the generated code is executed in, to which exact types are added.
+
+    Returns:
+        str: The condition, as source code.
+    """
+    condition = f"{name} is not None"
+    if len(exact_types) == 1:
+        (namespace[f"__exact_type{suffix}"],) = exact_types
+        condition += f" and __type({name}) is not __exact_type{suffix}"
+    elif exact_types:
+        namespace[f"__exact_types{suffix}"] = exact_types
+        condition += f" and __type({name}) not in __exact_types{suffix}"
+    return condition + f" and not __check{suffix}({name})"
+
+
+def _set_init_metadata(
+    init: FunctionType, cls: type, signature: inspect.Signature, doc_string: str
+) -> None:
+    """
+    Names and documents a constructor created for a SchemaObject subclass.
+
+    Args:
+        init (FunctionType): The constructor.
+        cls (type): The class the constructor is created for.
+        signature (inspect.Signature): The signature to report for the constructor.
+        doc_string (str): The docstring of the constructor.
+
+    Returns:
+        None
+    """
+    init.__name__ = "__init__"
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    init.__module__ = cls.__module__
+    init.__signature__ = signature
+    init.__doc__ = doc_string
+
+
+@lru_cache(maxsize=None)
+def _compile_init_source(source: str) -> CodeType:
+    """
+    Compiles the source of a generated SchemaObject constructor.
+
+    The source only depends on the property names, which of them have defaults and whether additional properties
+    are accepted, as type hints, casters and defaults are passed in through the namespace it is executed in. Classes
+    with the same shape therefore share the compiled code.
+
+    Args:
+        source (str): The source of the constructor definition.
+
+    Returns:
+        CodeType: The compiled module code, which defines `__init__` when executed.
+    """
+    return compile(source, "<generated SchemaObject.__init__>", "exec")
+
+
 class SchemaObject(ABC):
     """
     Base class for dynamically generated schema objects from schema definitions.
@@ -106,25 +347,21 @@ class SchemaObject(ABC):
         super().__init_subclass__(**kwargs)
         cls._added_properties = {}
         cls._special_names_set = set()
+        cls._schema_names = _SchemaNames(cls._special_names_set)
+        cls._attribute_names = _AttributeNames(
+            cls._special_names_set, cls._schema_names
+        )
         cls._doc_string_base = (
             f"Initialize a TA Instruments `{cls.__name__}` object.\n\nArgs:"
         )
         cls._kwargs_property = None
         cls._update_init()
 
-        # clean up docstrings
-        from_dict_copy = copy_function(cls.from_dict)
-        from_dict_copy.__annotations__["return"] = cls.__name__
-        from_dict_copy.__doc__ = from_dict_copy.__doc__.replace(
-            "SchemaObject", cls.__name__
-        )
-        cls.from_dict = classmethod(from_dict_copy)
-        from_json_copy = copy_function(cls.from_json)
-        from_json_copy.__annotations__["return"] = cls.__name__
-        from_json_copy.__doc__ = from_json_copy.__doc__.replace(
-            "SchemaObject", cls.__name__
-        )
-        cls.from_json = classmethod(from_json_copy)
+        # clean up docstrings, keeping methods overridden by the subclass or any of its bases
+        for name in ("from_dict", "from_json"):
+            function = _find_class_method_function(cls, name)
+            if function is not None:
+                setattr(cls, name, _DocumentedClassMethod(name, function))
 
     @classmethod
     def _add_property(
@@ -154,11 +391,25 @@ class SchemaObject(ABC):
         Returns:
             None
         """
-        cls._added_properties[name] = {
-            "caster": caster,
-            "type_hint": type_hint,
-            "default": default,
-        }
+        cls._added_properties[name] = PropertyDetails(caster, type_hint, default)
+        cls._update_init()
+
+    @classmethod
+    def _add_properties(cls, properties: Dict[str, PropertyDetails]):
+        """
+        Dynamically adds several properties to the class at once, as `_add_property` does for each of them.
+
+        The constructor is only updated once all of the properties have been added, rather than once per property,
+        which makes adding the properties of a class linear rather than quadratic in their number.
+
+        Args:
+            properties (Dict[str, PropertyDetails]): The caster, type hint and default of each property to add, by
+                                                     property name, in the order they should appear in the constructor.
+
+        Returns:
+            None
+        """
+        cls._added_properties.update(properties)
         cls._update_init()
 
     @classmethod
@@ -181,10 +432,7 @@ class SchemaObject(ABC):
         """
         if type_hint is None:
             type_hint = Any
-        cls._kwargs_property = {
-            "caster": caster,
-            "type_hint": type_hint,
-        }
+        cls._kwargs_property = PropertyDetails(caster, type_hint)
         cls._update_init()
 
     @classmethod
@@ -215,67 +463,105 @@ class SchemaObject(ABC):
                 inspect.Parameter(
                     name,
                     param_kind,
-                    default=property_details["default"],
-                    annotation=property_details["type_hint"],
+                    default=property_details.default,
+                    annotation=property_details.type_hint,
                 )
             )
-            type_hint_str = type_hint_to_str(property_details["type_hint"])
+            type_hint_str = type_hint_to_str(property_details.type_hint)
             doc_string += f"\n    {name} ({type_hint_str})"
 
         if cls._kwargs_property is not None:
-            type_hint_str = type_hint_to_str(cls._kwargs_property["type_hint"])
+            type_hint_str = type_hint_to_str(cls._kwargs_property.type_hint)
             doc_string += f"\n    **kwargs: {type_hint_str} (optional)"
             parameters.append(
                 inspect.Parameter(
                     "kwargs",
                     inspect.Parameter.VAR_KEYWORD,
-                    annotation=cls._kwargs_property["type_hint"],
+                    annotation=cls._kwargs_property.type_hint,
                 )
             )
 
         new_sig = inspect.Signature(parameters)
 
-        @wraps(cls.__init__)
+        # the specialised constructor is generated on first instantiation rather than here, as properties are
+        # added one at a time while the classes are built and compiling it after each one would be wasteful
         def replacement_init_function(self, *args, **kwargs):
-            bound_args = new_sig.bind(self, *args, **kwargs)
-            bound_args.apply_defaults()
-
-            # test and cast types
-            for name, value in bound_args.arguments.items():
-                if name != "self" and name != "kwargs":
-                    expected_type = cls._added_properties[name]["type_hint"]
-                    if value is not None and not is_instance(value, expected_type):
-                        try:
-                            caster = cls._added_properties[name]["caster"]
-                            if caster is datetime:
-                                value = dateutil_parser.parse(value)
-                            else:
-                                value = caster(value)
-                        except (ValueError, TypeError) as e:
-                            raise TypeError(
-                                f"Argument '{name}' must be of type {expected_type} (value:{value}, type:{type(value)})"
-                            ) from e
-                    setattr(self, name, value)
-
-            if "kwargs" in bound_args.arguments and cls._kwargs_property is not None:
-                for key, value in bound_args.arguments["kwargs"].items():
-                    expected_type = cls._kwargs_property["type_hint"]
-                    if value is not None and not is_instance(value, expected_type):
-                        try:
-                            caster = cls._kwargs_property["caster"]
-                            if caster is datetime:
-                                value = dateutil_parser.parse(value)
-                            else:
-                                value = caster(value)
-                        except (ValueError, TypeError) as e:
-                            raise TypeError(
-                                f"Argument '{name}' must be of type {expected_type} (value:{value}, type:{type(value)})"
-                            ) from e
-                    self.__dict__[key] = value
+            generated_init_function = cls._generate_init()
+            _set_init_metadata(generated_init_function, cls, new_sig, doc_string)
+            cls.__init__ = generated_init_function
+            generated_init_function(self, *args, **kwargs)
 
+        _set_init_metadata(replacement_init_function, cls, new_sig, doc_string)
         cls.__init__ = replacement_init_function
-        cls.__init__.__signature__ = new_sig
-        cls.__init__.__doc__ = doc_string
+
+    @classmethod
+    def _generate_init(cls):
+        """
+        Generates a constructor specialised to the properties currently added to the class.
+
+        The constructor is compiled from generated source so that binding, checking and casting each argument is
+        straight-line code, rather than a loop over the signature on every instantiation. Values that are not
+        `None` and do not match their type hint (as checked by `get_type_checker`) are cast with the property's
+        caster, and any additional keyword arguments are cast with the additional properties caster and stored on
+        the instance.
+
+        Returns:
+            Callable: The generated `__init__` function.
+        """
+        # properties may be named after builtins (such as `type`), so builtins used are bound to reserved names
+        namespace = {"__cast_value": _cast_value, "__type": type}
+        arguments = ["self"]
+        body = []
+        for index, (name, property_details) in enumerate(cls._added_properties.items()):
+            if property_details.default is inspect.Parameter.empty:
+                arguments.append(name)
+            else:
+                namespace[f"__default_{index}"] = property_details.default
+                arguments.append(f"{name}=__default_{index}")
+            namespace[f"__caster_{index}"] = property_details.caster
+            namespace[f"__type_hint_{index}"] = property_details.type_hint
+            namespace[f"__check_{index}"] = get_type_checker(property_details.type_hint)
+            condition = _type_check_condition(
+                name,
+                f"_{index}",
+                get_exact_types(property_details.type_hint),
+                namespace,
+            )
+            body += [
+                f"    if {condition}:",
+                f"        {name} = __cast_value({name!r}, {name}, __caster_{index}, __type_hint_{index})",
+                f"    self.{name} = {name}",
+            ]
+
+        if cls._kwargs_property is not None and cls._kwargs_property.type_hint is Any:
+            # values of any type are stored as they are, without a loop in Python
+            arguments.append("**kwargs")
+            body.append("    self.__dict__.update(kwargs)")
+        elif cls._kwargs_property is not None:
+            namespace["__caster_kwargs"] = cls._kwargs_property.caster
+            namespace["__type_hint_kwargs"] = cls._kwargs_property.type_hint
+            namespace["__check_kwargs"] = get_type_checker(
+                cls._kwargs_property.type_hint
+            )
+            condition = _type_check_condition(
+                "value",
+                "_kwargs",
+                get_exact_types(cls._kwargs_property.type_hint),
+                namespace,
+            )
+            arguments.append("**kwargs")
+            body += [
+                "    for key, value in kwargs.items():",
+                f"        if {condition}:",
+                "            value = __cast_value(key, value, __caster_kwargs, __type_hint_kwargs)",
+                "        self.__dict__[key] = value",
+            ]
+
+        source = "\n".join(
+            [f"def __init__({', '.join(arguments)}):", *(body or ["    pass"])]
+        )
+        exec(_compile_init_source(source), namespace)
+        return namespace["__init__"]
 
     @classmethod
     def _combine_multiinheritance_inits(cls):
@@ -309,11 +595,11 @@ class SchemaObject(ABC):
                         inspect.Parameter(
                             name,
                             param_kind,
-                            default=property_details["default"],
-                            annotation=property_details["type_hint"],
+                            default=property_details.default,
+                            annotation=property_details.type_hint,
                         )
                     )
-                    type_hint_str = type_hint_to_str(property_details["type_hint"])
+                    type_hint_str = type_hint_to_str(property_details.type_hint)
                     doc_string += f"\n    {name} ({type_hint_str})"
                 added_properties.update(supercls._added_properties)
 
@@ -321,13 +607,13 @@ class SchemaObject(ABC):
             if supercls._kwargs_property is not None and "kwargs" not in [
                 p.name for p in parameters
             ]:
-                type_hint_str = type_hint_to_str(supercls._kwargs_property["type_hint"])
+                type_hint_str = type_hint_to_str(supercls._kwargs_property.type_hint)
                 doc_string += f"\n    **kwargs: Dict[str, {type_hint_str}] (optional)"
                 parameters.append(
                     inspect.Parameter(
                         "kwargs",
                         inspect.Parameter.VAR_KEYWORD,
-                        annotation=supercls._kwargs_property["type_hint"],
+                        annotation=supercls._kwargs_property.type_hint,
                     ),
                 )
                 cls._kwargs_property = supercls._kwargs_property
@@ -335,31 +621,41 @@ class SchemaObject(ABC):
         cls._added_properties = added_properties
         new_sig = inspect.Signature(parameters)
 
-        @wraps(cls.__init__)
+        # the parameters each parent constructor accepts, resolved once rather than on every instantiation; as
+        # defaults are applied, each of them is always among the bound arguments
+        super_inits = []
+        for supercls in cls.__mro__[1:-2]:
+            super_params = inspect.signature(supercls.__init__).parameters
+            super_inits.append(
+                (
+                    supercls,
+                    tuple(
+                        name for name in super_params if name not in ("self", "kwargs")
+                    ),
+                    "kwargs" in super_params,
+                )
+            )
+
         def replacement_init_function(self, *args, **kwargs):
             bound_args = new_sig.bind(self, *args, **kwargs)
             bound_args.apply_defaults()
-            for supercls in cls.__mro__[1:-2]:
-                super_kwargs = {}
-                super_params = inspect.signature(supercls.__init__).parameters
-                for name, value in bound_args.arguments.items():
-                    if name != "self" and name != "kwargs" and name in super_params:
-                        super_kwargs[name] = value
-                if "kwargs" in super_params:
-                    for name, value in bound_args.arguments.get("kwargs", {}).items():
-                        super_kwargs[name] = value
+            arguments = bound_args.arguments
+            for supercls, super_param_names, super_accepts_kwargs in super_inits:
+                super_kwargs = {name: arguments[name] for name in super_param_names}
+                if super_accepts_kwargs:
+                    super_kwargs.update(arguments.get("kwargs", {}))
                 supercls.__init__(self, **super_kwargs)
 
+        _set_init_metadata(replacement_init_function, cls, new_sig, doc_string)
         cls.__init__ = replacement_init_function
-        cls.__init__.__signature__ = new_sig
-        cls.__init__.__doc__ = doc_string
 
     @classmethod
     def from_json(cls, path_or_file: Union[str, os.PathLike, TextIO]) -> "SchemaObject":
         """
         Creates an instance of the class by reading from a JSON file or file-like object.
 
-        Note that the file is loaded entirely into memory, and files can be large.
+        Note that the file is loaded entirely into memory, and files can be large. It is parsed with `orjson` when
+        it is installed (`pip install "tadatakit[orjson]"`), which is considerably faster for large files.
 
         Args:
             path_or_file (Union[str, os.PathLike, TextIO]): The path to a JSON file or a file-like object
@@ -375,12 +671,12 @@ class SchemaObject(ABC):
                        dictionary does not perfectly align with the class's expected attributes.
         """
         if isinstance(path_or_file, (str, os.PathLike)):
-            with open(path_or_file, "r") as file:
-                data = json.load(file)
+            with open(path_or_file, "rb") as file:
+                content = file.read()
         else:
-            data = json.load(path_or_file)
+            content = path_or_file.read()
 
-        return cls.from_dict(data)
+        return cls.from_dict(_parse_json(content))
 
     @classmethod
     def from_dict(cls, data_dict: Dict) -> "SchemaObject":
@@ -403,9 +699,8 @@ class SchemaObject(ABC):
             TypeError: If a required property is missing or if there is a type mismatch, indicating that the
                        dictionary does not perfectly align with the class's expected attributes.
         """
-        data_dict = {
-            pascal_to_snake(k, cls._special_names_set): v for k, v in data_dict.items()
-        }
+        attribute_names = cls._attribute_names
+        data_dict = {attribute_names[k]: v for k, v in data_dict.items()}
         try:
             return cls(**data_dict)
         except TypeError as e:
@@ -426,20 +721,21 @@ class SchemaObject(ABC):
             Dict[str, Any]: A dictionary representation of the SchemaObject instance, with property names converted
                             to PascalCase to align with the schema.
         """
+        schema_names = self._schema_names
         result = {}
         for prop_name, value in self.__dict__.items():
-            if isinstance(value, SchemaObject) or isinstance(value, IdDescriptionEnum):
-                result[
-                    snake_to_pascal(prop_name, self._special_names_set)
-                ] = value.to_dict()
+            if type(value) in _PLAIN_VALUE_TYPES:
+                result[schema_names[prop_name]] = value
+            elif isinstance(value, SchemaObject) or isinstance(
+                value, IdDescriptionEnum
+            ):
+                result[schema_names[prop_name]] = value.to_dict()
             elif (
                 isinstance(value, list) and value and isinstance(value[0], SchemaObject)
             ):
-                result[snake_to_pascal(prop_name, self._special_names_set)] = [
-                    item.to_dict() for item in value
-                ]
+                result[schema_names[prop_name]] = [item.to_dict() for item in value]
             else:
-                result[snake_to_pascal(prop_name, self._special_names_set)] = value
+                result[schema_names[prop_name]] = value
         return result
 
     def to_json(self, path_or_file: Union[str, os.PathLike, TextIO]) -> None:
@@ -1,15 +1,26 @@
 from typing import Dict, Union, TextIO, Any, List, Tuple, Type, Optional
+import inspect
 import os
 import json
-from collections import defaultdict
 from datetime import datetime
-from dateutil import parser as dateutil_parser
 from uuid import UUID
 from enum import Enum
 
-from .base_classes import native_type_mapping, SchemaObject, IdDescriptionEnum
+from .base_classes import (
+    native_type_mapping,
+    SchemaObject,
+    IdDescriptionEnum,
+    PropertyDetails,
+)
 from .polymorph_factory import PolymorphFactory
-from .utils import pascal_to_snake, split_props_by_required, pascal_to_screaming_snake
+from .utils import (
+    pascal_to_snake,
+    split_props_by_required,
+    pascal_to_screaming_snake,
+    get_ref_name,
+    intern_keys,
+    parse_datetime,
+)
 
 # named constants for definition types
 NATIVE = "native"
@@ -21,6 +32,18 @@ UNION = "union"
 POLYMORPH = "polymorph"
 ENUM = "enum"
 
+# definition types in the order their types are added, so dependencies are defined before they are used
+DEFINITION_TYPES = [
+    NATIVE,
+    ENUM,
+    CUSTOM,
+    PASSTHROUGH,
+    MULTIINHERITANCE,
+    LIST,
+    UNION,
+    POLYMORPH,
+]
+
 
 class DefinitionUnidentifiedError(Exception):
     """Custom exception for when schema definition cannot be identified."""
@@ -41,9 +64,14 @@ class DefinitionRegistry:
         _type_hints (Dict[str, Type]): A mapping from definition names to their resolved Python type hints.
         _casters (Dict[str, Callable]): A mapping from definition names to functions that cast or transform data into
                                        their corresponding Python types.
+        _list_type_hints_and_casters (Dict[str, Tuple[Type, Callable]]): A mapping from referenced definition names to
+                                                                   the shared type hint and caster for arrays of them.
         _definitions (Dict): A subset of the schema, focusing on the 'components/schemas' section.
         _definition_identities (Dict[str, str]): A dictionary mapping definition names to their identified type category.
-        _definition_groups (DefaultDict[str, List[str]]): A dictionary grouping definition names by their type category.
+        _definition_groups (Dict[str, List[str]]): A dictionary grouping definition names by their type category,
+                                                   with an entry for every category.
+        _definition_type_cache (Dict[int, Tuple[Dict, str]]): Definition type categories memoized by the identity of the
+                                                              definition dictionary during initialization.
     """
 
     def __init__(self, schema: Dict) -> None:
@@ -60,7 +88,10 @@ class DefinitionRegistry:
         self._schema = schema
         self._type_hints = {}
         self._casters = {}
-        self._definitions = schema.get("$defs", {})
+        self._list_type_hints_and_casters = {}
+        self._definition_type_cache = {}
+        # copied, as derived definitions are added to it and the schema may be shared
+        self._definitions = dict(schema.get("$defs", {}))
         self._generate_native_pattern_mapping()
         self._definitions.update(
             {
@@ -90,8 +121,8 @@ class DefinitionRegistry:
         Creates an instance of `DefinitionRegistry` from a schema stored in a file or file-like object.
 
         This class method facilitates the initialization of the registry directly from a JSON file or
-        a file-like object that outputs JSON. It reads the JSON schema, parses it, and uses it to initialize
-        and return a new instance of `DefinitionRegistry`.
+        a file-like object that outputs JSON. It reads the JSON schema, parses it, interns its keys (as
+        `load_schema` does) and uses it to initialize and return a new instance of `DefinitionRegistry`.
 
         Args:
             path_or_file (Union[str, os.PathLike, TextIO]): The path to the JSON schema file or a file-like object
@@ -110,7 +141,7 @@ class DefinitionRegistry:
         else:
             schema = json.load(path_or_file)
 
-        return cls(schema)
+        return cls(intern_keys(schema))
 
     def _initialize_definitions(self):
         """
@@ -132,19 +163,11 @@ class DefinitionRegistry:
         """
         self._group_schema_by_definition_type()
         # add them in order
-        for definition_type in [
-            NATIVE,
-            ENUM,
-            CUSTOM,
-            PASSTHROUGH,
-            MULTIINHERITANCE,
-            LIST,
-            UNION,
-            POLYMORPH,
-        ]:
+        for definition_type in DEFINITION_TYPES:
             self._add_types_by_group(definition_type)
         self._add_custom_types_from_props()
         self._add_properties_to_custom_types()
+        self._definition_type_cache.clear()
 
     def _group_schema_by_definition_type(self):
         """
@@ -162,19 +185,48 @@ class DefinitionRegistry:
         Returns:
             None
         """
-        self._definition_identities = {
-            k: self._identify_definition_type(v) for k, v in self._definitions.items()
+        self._definition_identities = {}
+        self._definition_groups = {
+            definition_type: [] for definition_type in DEFINITION_TYPES
         }
-        self._definition_groups = defaultdict(list)
-        for key, value in self._definition_identities.items():
-            self._definition_groups[value].append(key)
+        for key, definition in self._definitions.items():
+            definition_type = self._identify_definition_type(definition)
+            self._definition_identities[key] = definition_type
+            self._definition_groups[definition_type].append(key)
 
     def _identify_definition_type(self, definition: Dict[str, Any]):
         """
-        Identifies the type category of a given schema definition based on its structure and content.
+        Identifies the type category of a given schema definition, memoizing the result.
+
+        The same definition dictionaries are classified many times while the registry is initialized (once when
+        grouping, then again when building type hints, casters and properties). Results are cached by the identity
+        of the definition dictionary for the duration of the initialization. See `_classify_definition` for the
+        categories returned.
+
+        Args:
+            definition (Dict[str, Any]): The schema definition to analyze.
 
-        This method examines the keys and values in a schema definition to determine its appropriate type
-        category. The definitions are categorized as follows:
+        Returns:
+            str: The category type of the definition.
+
+        Raises:
+            DefinitionUnidentifiedError: If the definition does not match any known pattern or if it lacks
+                                         required elements to determine its type.
+        """
+        cached = self._definition_type_cache.get(id(definition))
+        if cached is not None:
+            return cached[1]
+        definition_type = self._classify_definition(definition)
+        # hold a reference to the definition so its id cannot be reused while cached
+        self._definition_type_cache[id(definition)] = (definition, definition_type)
+        return definition_type
+
+    @staticmethod
+    def _classify_definition(definition: Dict[str, Any]):
+        """
+        Classifies a schema definition into a type category based on its structure and content.
+
+        The definitions are categorized as follows:
         - 'passthrough': Definitions that refer directly to another definition using `$ref`.
         - 'multi-inheritance': Definitions that use `allOf` indicating inheritance from multiple types.
         - 'polymorph': Definitions using `allOf` with conditions, typically involving 'if' and 'then' to support polymorphic behavior.
@@ -248,7 +300,7 @@ class DefinitionRegistry:
         if not definition:
             return Any, lambda x: x
         elif "$ref" in definition:
-            ref_name = definition["$ref"].split("/")[-1]
+            ref_name = get_ref_name(definition["$ref"])
             ref_type_hint = self._type_hints[ref_name]
             if not isinstance(ref_type_hint, SchemaObject):
                 return ref_type_hint, self._casters[ref_name]
@@ -270,7 +322,7 @@ class DefinitionRegistry:
                         then_definition
                     )
                     if then_definition_type == PASSTHROUGH:
-                        ref_name = then_definition["$ref"].split("/")[-1]
+                        ref_name = get_ref_name(then_definition["$ref"])
                         union_type_hints.append(self._type_hints[ref_name])
                     else:
                         raise DefinitionUnidentifiedError(
@@ -279,32 +331,36 @@ class DefinitionRegistry:
                 polymorph_factory = PolymorphFactory(self, definition)
                 type_hint = Union[tuple(union_type_hints)]
                 return type_hint, polymorph_factory.discriminate
+            type_hints = self._type_hints
             parent_classes = []
-            undefined_class_count = 0
+            stub_classes = {}
+            stub_definitions = {}
             for parent_definition in definition["allOf"]:
                 parent_definition_type = self._identify_definition_type(
                     parent_definition
                 )
                 if parent_definition_type == PASSTHROUGH:
-                    ref_name = parent_definition["$ref"].split("/")[-1]
-                    ParentClass = self._type_hints[ref_name]
-                    parent_classes.append(ParentClass)
+                    ref_name = get_ref_name(parent_definition["$ref"])
+                    parent_classes.append(type_hints[ref_name])
                 elif parent_definition_type == CUSTOM:
                     new_parent_class_name = (
-                        f"{definition_name}_Parent{undefined_class_count}"
+                        f"{definition_name}_Parent{len(stub_classes)}"
                     )
                     stub_class = type(new_parent_class_name, (SchemaObject,), {})
-                    self._definitions[new_parent_class_name] = parent_definition
-                    self._type_hints[new_parent_class_name] = stub_class
-                    self._casters[new_parent_class_name] = stub_class
-                    self._definition_identities[new_parent_class_name] = CUSTOM
-                    self._definition_groups[CUSTOM].append(new_parent_class_name)
+                    stub_classes[new_parent_class_name] = stub_class
+                    stub_definitions[new_parent_class_name] = parent_definition
                     parent_classes.append(stub_class)
                 else:
                     raise DefinitionUnidentifiedError(
                         f"`{parent_definition_type}` not supported for a parent ",
                         "class in a multi-inheritance-type definition",
                     )
+            if stub_classes:
+                self._definitions.update(stub_definitions)
+                type_hints.update(stub_classes)
+                self._casters.update(stub_classes)
+                self._definition_identities.update(dict.fromkeys(stub_classes, CUSTOM))
+                self._definition_groups[CUSTOM].extend(stub_classes)
             MultiinheritanceClass = type(definition_name, tuple(parent_classes), {})
             return MultiinheritanceClass, MultiinheritanceClass.from_dict
         elif "oneOf" in definition or "anyOf" in definition:
@@ -312,7 +368,7 @@ class DefinitionRegistry:
             for oneof_definition in definition.get("oneOf", definition.get("anyOf")):
                 oneof_definition_type = self._identify_definition_type(oneof_definition)
                 if oneof_definition_type == PASSTHROUGH:
-                    ref_name = oneof_definition["$ref"].split("/")[-1]
+                    ref_name = get_ref_name(oneof_definition["$ref"])
                     union_type_hints.append(self._type_hints[ref_name])
                 else:
                     raise DefinitionUnidentifiedError(
@@ -320,48 +376,39 @@ class DefinitionRegistry:
                     )
             type_hint = Union[tuple(union_type_hints)]
             return type_hint, lambda x: x
-        elif (def_type := definition.get("type")) in native_type_mapping:
-            if def_type == "object":
-                if definition_name in self._type_hints:
-                    type_hint = self._type_hints[definition_name]
-                    caster = self._casters[definition_name]
-                else:
-                    type_hint = type(definition_name, (SchemaObject,), {})
-                    caster = type_hint.from_dict
-                    self._definitions[definition_name] = definition
-                    self._type_hints[definition_name] = type_hint
-                    self._casters[definition_name] = caster
-                    self._definition_identities[definition_name] = CUSTOM
-                    self._definition_groups[CUSTOM].append(definition_name)
-                return type_hint, caster
-            elif def_type == "array":
+        elif (
+            python_type := native_type_mapping.get(definition.get("type"))
+        ) is not None:
+            if python_type is dict:
+                return self._get_or_create_custom_type(definition_name, definition)
+            elif python_type is list:
                 item_definition = definition["items"]
                 item_definition_type = self._identify_definition_type(item_definition)
                 if item_definition_type == PASSTHROUGH:
-                    ref_name = item_definition["$ref"].split("/")[-1]
-                    item_type_hint = self._type_hints[ref_name]
-                    item_caster = self._casters[ref_name]
+                    # arrays of the same referenced definition share a type hint and caster
+                    ref_name = get_ref_name(item_definition["$ref"])
+                    if ref_name not in self._list_type_hints_and_casters:
+                        item_caster = self._casters[ref_name]
+                        self._list_type_hints_and_casters[ref_name] = (
+                            List[self._type_hints[ref_name]],
+                            lambda x: [item_caster(a) for a in x],
+                        )
+                    return self._list_type_hints_and_casters[ref_name]
                 elif item_definition_type == CUSTOM:
-                    item_class_name = f"{definition_name}_Item"
-                    item_type_hint = type(item_class_name, (SchemaObject,), {})
-                    item_caster = item_type_hint.from_dict
-                    self._definitions[item_class_name] = item_definition
-                    self._type_hints[item_class_name] = item_type_hint
-                    self._casters[item_class_name] = item_caster
-                    self._definition_identities[item_class_name] = CUSTOM
-                    self._definition_groups[CUSTOM].append(item_class_name)
+                    item_type_hint, item_caster = self._get_or_create_custom_type(
+                        f"{definition_name}_Item", item_definition
+                    )
                 else:
                     raise DefinitionUnidentifiedError(
                         f"Item type: `{item_definition_type}` not supported for an array"
                     )
                 return List[item_type_hint], lambda x: [item_caster(a) for a in x]
-            python_type = native_type_mapping[def_type]
-            pattern = self._native_pattern_mapping.get(definition.get("pattern"))
-            if pattern is not None:
-                python_type = pattern
-            type_hint = python_type
-            caster = dateutil_parser.parse if python_type == datetime else python_type
-            return type_hint, caster
+            if "pattern" in definition:
+                python_type = self._native_pattern_mapping.get(
+                    definition["pattern"], python_type
+                )
+            caster = parse_datetime if python_type is datetime else python_type
+            return python_type, caster
         elif "enum" in definition:
             enum_class = Enum(
                 "Classification",
@@ -378,6 +425,35 @@ class DefinitionRegistry:
         else:
             raise DefinitionUnidentifiedError(f"{definition}")
 
+    def _get_or_create_custom_type(
+        self, definition_name: str, definition: Dict
+    ) -> Tuple[Type, Any]:
+        """
+        Gets the custom type registered under a name, creating it if it does not exist yet.
+
+        New types are empty SchemaObject subclasses, which receive their properties in
+        `_add_properties_to_custom_types`. When the definition is not one of the schema's own definitions (e.g. an
+        object nested in a property or the items of an array), it is also registered as a custom definition so that
+        its properties are added.
+
+        Args:
+            definition_name (str): The name of the type.
+            definition (Dict): The object definition the type represents.
+
+        Returns:
+            Tuple[Type, Any]: The type and its caster.
+        """
+        if definition_name not in self._type_hints:
+            custom_type = type(definition_name, (SchemaObject,), {})
+            self._type_hints[definition_name] = custom_type
+            self._casters[definition_name] = custom_type.from_dict
+            # schema definitions are already grouped, only derived ones need registering
+            if definition_name not in self._definition_identities:
+                self._definitions[definition_name] = definition
+                self._definition_identities[definition_name] = CUSTOM
+                self._definition_groups[CUSTOM].append(definition_name)
+        return self._type_hints[definition_name], self._casters[definition_name]
+
     def _add_types_by_group(self, definition_type: str):
         """
         Processes and registers type hints and casters for all definitions in a specific category.
@@ -416,22 +492,19 @@ class DefinitionRegistry:
         Returns:
             None
         """
+        definitions = self._definitions
+        identify_definition_type = self._identify_definition_type
+        # not a snapshot, types created here are appended to the group so nested objects are handled too
         for definition_name in self._definition_groups[CUSTOM]:
-            definition = self._definitions[definition_name]
+            definition = definitions[definition_name]
             for property_name, property_definition in definition.get(
                 "properties", {}
             ).items():
-                prop_def_type = self._identify_definition_type(property_definition)
-                if prop_def_type == CUSTOM:
-                    prop_class_name = (
-                        f"{definition_name}_{pascal_to_snake(property_name, set())}"
+                if identify_definition_type(property_definition) == CUSTOM:
+                    # named as in `_add_properties_to_custom_types`, so the property uses this type
+                    self._get_or_create_custom_type(
+                        f"{definition_name}_{property_name}", property_definition
                     )
-                    prop_type_hint = type(prop_class_name, (SchemaObject,), {})
-                    self._definitions[prop_class_name] = property_definition
-                    self._type_hints[prop_class_name] = prop_type_hint
-                    self._casters[prop_class_name] = prop_type_hint
-                    self._definition_identities[prop_class_name] = CUSTOM
-                    self._definition_groups[CUSTOM].append(prop_class_name)
 
     def _add_properties_to_custom_types(self):
         """
@@ -452,31 +525,34 @@ class DefinitionRegistry:
         Returns:
             None
         """
+        definitions = self._definitions
+        type_hints = self._type_hints
+        create_type_hint_and_caster = self._create_type_hint_and_caster
+        # not a snapshot, object and array item types created while adding properties are appended to the group
         for definition_name in self._definition_groups[CUSTOM]:
-            definition = self._definitions[definition_name]
-            cls = self._type_hints[definition_name]
+            definition = definitions[definition_name]
+            cls = type_hints[definition_name]
             required_props, non_required_props = split_props_by_required(definition)
+            # collected and added together, so the constructor is updated once per class rather than per property
+            properties = {}
             for prop_name, prop_definition in required_props.items():
-                type_hint, caster = self._create_type_hint_and_caster(
+                type_hint, caster = create_type_hint_and_caster(
                     prop_definition, f"{definition_name}_{prop_name}"
                 )
-                cls._add_property(
-                    pascal_to_snake(prop_name, cls._special_names_set),
-                    caster,
-                    type_hint,
+                properties[cls._attribute_names[prop_name]] = PropertyDetails(
+                    caster, type_hint, inspect.Parameter.empty
                 )
             for prop_name, prop_definition in non_required_props.items():
-                type_hint, caster = self._create_type_hint_and_caster(
+                type_hint, caster = create_type_hint_and_caster(
                     prop_definition, f"{definition_name}_{prop_name}"
                 )
-                cls._add_property(
-                    pascal_to_snake(prop_name, cls._special_names_set),
-                    caster,
-                    Optional[type_hint],
-                    default=None,
+                properties[cls._attribute_names[prop_name]] = PropertyDetails(
+                    caster, Optional[type_hint], None
                 )
+            if properties:
+                cls._add_properties(properties)
             if "additionalProperties" in definition:
-                type_hint, caster = self._create_type_hint_and_caster(
+                type_hint, caster = create_type_hint_and_caster(
                     definition.get("additionalProperties")
                 )
                 cls._add_additional_properties(caster, type_hint)
@@ -540,6 +616,9 @@ class DefinitionRegistry:
         Returns:
             None
         """
-        for category in [ENUM, CUSTOM, PASSTHROUGH, MULTIINHERITANCE]:
-            for definition_name in self._definition_groups[category]:
-                globals_dict[definition_name] = self._type_hints[definition_name]
+        type_hints = self._type_hints
+        globals_dict.update(
+            (definition_name, type_hints[definition_name])
+            for category in [ENUM, CUSTOM, PASSTHROUGH, MULTIINHERITANCE]
+            for definition_name in self._definition_groups[category]
+        )
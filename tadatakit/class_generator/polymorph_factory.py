@@ -1,4 +1,6 @@
-from typing import Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .utils import get_ref_name
 
 
 class PolymorphFactory:
@@ -27,13 +29,128 @@ class PolymorphFactory:
         """
         self.definition_registry = definition_registry
         self.conditions = definition["allOf"]
+        (
+            self._discriminator_properties,
+            self._dispatch_table,
+        ) = self._build_dispatch_table(self.conditions)
+        if self._dispatch_table is not None:
+            self.discriminate = self._make_table_discriminator()
+        self._conditions_exclusive = self._are_conditions_exclusive(self.conditions)
+        self._last_matched_condition = None
+
+    @staticmethod
+    def _build_dispatch_table(
+        conditions: List[Dict],
+    ) -> Tuple[Optional[Tuple[str, ...]], Optional[Dict]]:
+        """
+        Builds a lookup table from the values of the discriminating properties to schema reference names.
+
+        A table can only be built when every condition compares the same, non-empty set of properties against
+        hashable `const` values. When there is a single discriminating property the table is keyed by its value,
+        otherwise by a tuple of values in the order of the returned property names. If two conditions share the
+        same values the first one wins, matching the order in which conditions are evaluated.
+
+        Args:
+            conditions (List[Dict]): The `allOf` conditions of the polymorph definition.
+
+        Returns:
+            Tuple[Optional[Tuple[str, ...]], Optional[Dict]]: The discriminating property names and the lookup table,
+                                                              or `(None, None)` if the conditions cannot be tabulated.
+        """
+        discriminator_properties = None
+        dispatch_table = {}
+        for condition in conditions:
+            try:
+                if_clause = condition["if"]["properties"]
+                ref_name = get_ref_name(condition["then"]["$ref"])
+                condition_properties = tuple(sorted(if_clause))
+                values = tuple(
+                    if_clause[prop]["const"] for prop in condition_properties
+                )
+            except (KeyError, TypeError):
+                return None, None
+            if not condition_properties:
+                return None, None
+            if discriminator_properties is None:
+                discriminator_properties = condition_properties
+            elif condition_properties != discriminator_properties:
+                return None, None
+            key = values[0] if len(values) == 1 else values
+            try:
+                dispatch_table.setdefault(key, ref_name)
+            except TypeError:
+                return None, None
+        if discriminator_properties is None:
+            return None, None
+        return discriminator_properties, dispatch_table
+
+    @staticmethod
+    def _are_conditions_exclusive(conditions: List[Dict]) -> bool:
+        """
+        Checks whether at most one of the conditions can match any data.
+
+        This is the case when every pair of conditions requires different `const` values for at least one
+        property they share, so the first matching condition is also the only one.
+
+        Args:
+            conditions (List[Dict]): The `allOf` conditions of the polymorph definition.
+
+        Returns:
+            bool: True if the conditions are mutually exclusive, False if they may overlap or cannot be compared.
+        """
+        try:
+            if_clauses = [condition["if"]["properties"] for condition in conditions]
+            for index, first in enumerate(if_clauses):
+                for second in if_clauses[index + 1 :]:
+                    if not any(
+                        prop in second and value["const"] != second[prop]["const"]
+                        for prop, value in first.items()
+                    ):
+                        return False
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def _make_table_discriminator(self) -> Callable[[Dict], Any]:
+        """
+        Creates a discriminator that finds the matching schema reference with a single lookup in the dispatch table.
+
+        The dispatch table, discriminating properties and casters are bound as local names of the returned function,
+        rather than looked up as attributes on every call, as it is called for every polymorphic object deserialized.
+        Casters are still resolved when called, so the registry may add them after the factory is created.
+
+        Returns:
+            Callable[[Dict], Any]: A function that behaves as `discriminate`, replacing it on this instance.
+        """
+        dispatch_table = self._dispatch_table
+        casters = self.definition_registry._casters
+        properties = self._discriminator_properties
+        discriminator_property = properties[0] if len(properties) == 1 else None
+
+        def discriminate(data_dict: Dict):
+            if discriminator_property is not None:
+                key = data_dict.get(discriminator_property)
+            else:
+                key = tuple(data_dict.get(prop) for prop in properties)
+            try:
+                ref_name = dispatch_table.get(key)
+            except TypeError:
+                ref_name = None
+            if ref_name is None:
+                raise ValueError("Data does not match any conditions")
+            return casters[ref_name](data_dict)
+
+        discriminate.__doc__ = PolymorphFactory.discriminate.__doc__
+        return discriminate
 
     def discriminate(self, data_dict: Dict):
         """
         Determines and instantiates the correct schema object type based on the conditions specified in the JSON Schema.
 
         This method evaluates each condition in the `allOf` list to find the first match based on the `if` clause
-        and then uses the `then` clause to determine which schema reference to use for instantiation.
+        and then uses the `then` clause to determine which schema reference to use for instantiation. When all
+        conditions discriminate on the same properties, this is replaced on the instance by a function that finds
+        the match with a single lookup in a precomputed table instead (see `_make_table_discriminator`).
 
         Args:
             data_dict (Dict): The data dictionary containing the necessary data to evaluate conditions and instantiate the object.
@@ -44,14 +161,36 @@ class PolymorphFactory:
         Raises:
             ValueError: If no conditions match or if the data does not contain necessary fields to evaluate a condition.
         """
+        # consecutive objects usually take the same branch, so when only one condition can match, the last
+        # matched condition is tried first
+        last_matched_condition = self._last_matched_condition
+        if last_matched_condition is not None and self._condition_matches(
+            last_matched_condition, data_dict
+        ):
+            ref_name = get_ref_name(last_matched_condition["then"]["$ref"])
+            return self.definition_registry._casters[ref_name](data_dict)
+
         for condition in self.conditions:
-            if_clause = condition["if"]["properties"]
-            then_clause = condition["then"]["$ref"]
-            # Evaluate if all conditions in the if_clause are met
-            if all(
-                data_dict.get(prop) == value["const"]
-                for prop, value in if_clause.items()
-            ):
-                ref_name = then_clause.split("/")[-1]
+            if self._condition_matches(condition, data_dict):
+                if self._conditions_exclusive:
+                    self._last_matched_condition = condition
+                ref_name = get_ref_name(condition["then"]["$ref"])
                 return self.definition_registry._casters[ref_name](data_dict)
         raise ValueError("Data does not match any conditions")
+
+    @staticmethod
+    def _condition_matches(condition: Dict, data_dict: Dict) -> bool:
+        """
+        Evaluates whether all properties in the `if` clause of a condition are met by the data.
+
+        Args:
+            condition (Dict): A condition with an `if` clause of `const` properties.
+            data_dict (Dict): The data dictionary to evaluate.
+
+        Returns:
+            bool: True if the data matches the condition.
+        """
+        return all(
+            data_dict.get(prop) == value["const"]
+            for prop, value in condition["if"]["properties"].items()
+        )
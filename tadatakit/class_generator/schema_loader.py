@@ -1,16 +1,36 @@
 import json
 from typing import Dict
 from importlib import resources
+from functools import lru_cache
 
+from .utils import intern_keys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=1)
 def load_schema() -> Dict:
     """
     Load and return the JSON schema from the `tainstruments_triosdataschema` package.
 
+    The schema is parsed with `orjson` if it is installed, falling back to the standard library `json` module.
+    All dictionary keys in the returned schema are interned to speed up the repeated key lookups made while
+    generating classes.
+
+    The schema is only read and parsed on the first call; later calls return the same dictionary, which must
+    therefore not be modified. Use `load_schema.cache_clear()` to force it to be read again.
+
     Returns:
         Dict: The loaded JSON schema as a dictionary.
     """
-    with resources.files("tainstruments_triosdataschema").joinpath(
+    schema_file = resources.files("tainstruments_triosdataschema").joinpath(
         "TRIOSJSONExportSchema.json"
-    ).open("r") as f:
-        return json.load(f)
+    )
+    if orjson is not None:
+        with schema_file.open("rb") as f:
+            return intern_keys(orjson.loads(f.read()))
+    with schema_file.open("r") as f:
+        return intern_keys(json.load(f))
@@ -1,14 +1,43 @@
-from typing import Type, Any, get_origin, get_args, Union, Dict, Tuple, Optional
+from typing import (
+    Type,
+    Any,
+    Callable,
+    get_origin,
+    get_args,
+    Union,
+    Dict,
+    Tuple,
+    Optional,
+)
 from types import FunctionType
-import re
+from functools import lru_cache, partial
+from itertools import repeat
+import string
+import sys
 import datetime
 import uuid
+import weakref
+
+from dateutil import parser as dateutil_parser, tz as dateutil_tz
+
+_ASCII_UPPERCASE = frozenset(string.ascii_uppercase)
+_ASCII_LOWERCASE = frozenset(string.ascii_lowercase)
+_ASCII_LOWERCASE_OR_DIGITS = _ASCII_LOWERCASE | frozenset(string.digits)
+
+
+# string representations of type hints, keyed by the id of the type hint, with a weak reference to the type hint so
+# the entry is removed with it, and the classes of registries no longer in use are not kept alive by being documented
+_type_hint_strs: Dict[int, Tuple[weakref.ref, str]] = {}
 
 
 def type_hint_to_str(type_hint: Type) -> str:
     """
     Get a string representation of a type hint.
 
+    Representations are memoized, as the same type hints are documented each time a property is added to a class.
+    They are memoized by identity, as type hints that are equal may still be written differently (for example
+    `Union[int, str] == Union[str, int]`), and only for as long as the type hint exists.
+
     Args:
         type_hint (Type): The type hint to convert to a string.
 
@@ -16,13 +45,38 @@ def type_hint_to_str(type_hint: Type) -> str:
         str: A string representation of the type hint.
     """
     try:
-        return type_hint.__name__
-    except AttributeError:
-        return (
+        type_hint_ref, type_hint_str = _type_hint_strs[id(type_hint)]
+        if type_hint_ref() is type_hint:
+            return type_hint_str
+    except KeyError:
+        pass
+    # typing constructs such as `Union[str, int]` also have a `__name__` (`"Union"`) on recent Python versions, so
+    # only plain classes are named by it, and the unions and lists used by the schema are written out from their
+    # arguments, so the classes in them are named the same way
+    origin = get_origin(type_hint)
+    args = get_args(type_hint)
+    if origin is None and isinstance(type_hint, type):
+        type_hint_str = type_hint.__name__
+    elif origin is Union and len(args) == 2 and type(None) in args:
+        type_hint_str = f"Optional[{type_hint_to_str(args[args[0] is type(None)])}]"
+    elif origin is Union:
+        type_hint_str = f"Union[{', '.join(map(type_hint_to_str, args))}]"
+    elif origin is list and len(args) == 1:
+        type_hint_str = f"List[{type_hint_to_str(args[0])}]"
+    else:
+        type_hint_str = (
             type_hint.__str__()
             .replace("typing.", "")
             .replace("tadatakit.class_generator.definition_registry.", "")
         )
+    key = id(type_hint)
+    try:
+        type_hint_ref = weakref.ref(type_hint, lambda _: _type_hint_strs.pop(key, None))
+    except TypeError:
+        # some special forms (`Any` before Python 3.11) cannot be weakly referenced, and are cheap to convert anyway
+        return type_hint_str
+    _type_hint_strs[key] = (type_hint_ref, type_hint_str)
+    return type_hint_str
 
 
 def is_instance(obj: Any, type_hint: Type) -> bool:
@@ -54,6 +108,86 @@ def is_instance(obj: Any, type_hint: Type) -> bool:
         raise TypeError(f"type_hint: {type_hint}, obj: {obj}") from e
 
 
+@lru_cache(maxsize=4096)
+def get_type_checker(type_hint: Type) -> Callable[[Any], bool]:
+    """
+    Gets a function that checks objects against a type hint, with the same results as `is_instance`.
+
+    The type hint is decomposed once, when the checker is created, rather than on every check. Checkers are cached
+    per type hint, as the same few type hints are checked for every property of every object deserialized, and the
+    cache is bounded so that it does not keep the classes of every registry built alive.
+
+    Args:
+        type_hint (Type): The type hint against which objects are to be checked.
+
+    Returns:
+        Callable[[Any], bool]: A function that returns True if an object is an instance of the type hint.
+    """
+    if type_hint is Any:
+        return lambda obj: True
+    origin = get_origin(type_hint)
+    if origin is Union:
+        # plain classes in the union are checked together with a single isinstance call on a tuple of them
+        args = get_args(type_hint)
+        classes = tuple(
+            arg
+            for arg in args
+            if get_origin(arg) is None and isinstance(arg, type) and arg is not Any
+        )
+        checkers = tuple(get_type_checker(arg) for arg in args if arg not in classes)
+        if not checkers:
+            return lambda obj: isinstance(obj, classes)
+        return lambda obj: isinstance(obj, classes) or any(
+            checker(obj) for checker in checkers
+        )
+    elif origin is list:
+        element_type = get_args(type_hint)[0]
+
+        def check_list(obj: Any) -> bool:
+            if isinstance(obj, list):
+                # mapping isinstance keeps the loop over (possibly very long) data lists in C
+                return all(map(isinstance, obj, repeat(element_type)))
+            return is_instance(obj, type_hint)
+
+        return check_list
+    elif isinstance(type_hint, type):
+        return lambda obj: isinstance(obj, type_hint)
+    return partial(is_instance, type_hint=type_hint)
+
+
+@lru_cache(maxsize=4096)
+def get_exact_types(type_hint: Type) -> frozenset:
+    """
+    Gets the classes whose exact instances always match a type hint.
+
+    These are the type hint itself for a class, or the classes other than `NoneType` in a Union (such as the `X` of
+    `Optional[X]`). Checking `type(obj)` against them first lets the common, well-typed case skip the full check
+    made by `get_type_checker`. Like checkers, they are cached per type hint, with the same bound, as the same few
+    type hints are shared by the properties of many classes.
+
+    Args:
+        type_hint (Type): The type hint against which objects are to be checked.
+
+    Returns:
+        frozenset: The classes, which is empty if the type hint has no such classes (as for `Any` or `List[X]`).
+    """
+    if type_hint is Any:
+        return frozenset()
+    origin = get_origin(type_hint)
+    if origin is None and isinstance(type_hint, type):
+        return frozenset([type_hint])
+    elif origin is Union:
+        return frozenset(
+            arg
+            for arg in get_args(type_hint)
+            if get_origin(arg) is None
+            and isinstance(arg, type)
+            and arg is not type(None)
+            and arg is not Any
+        )
+    return frozenset()
+
+
 def pascal_to_snake(name: str, special_names_set: set) -> str:
     """
     Converts a PascalCase string to a snake_case string.
@@ -75,8 +209,56 @@ def pascal_to_snake(name: str, special_names_set: set) -> str:
     elif "_" in name:
         special_names_set.add(name)
         return name
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    return _pascal_to_snake(name)
+
+
+@lru_cache(maxsize=4096)
+def _pascal_to_snake(name: str) -> str:
+    """
+    Converts a PascalCase identifier without underscores to snake_case.
+
+    The conversion is cached, as the same property names are converted for every object deserialized.
+    Special names are handled by `pascal_to_snake` before this is called, so the cache has no side effects.
+    Results are interned, as they are passed as keyword arguments to the generated constructors, whose parameter
+    names are interned, so they can be matched by identity.
+
+    Args:
+        name (str): The PascalCase identifier to convert.
+
+    Returns:
+        str: The converted snake_case string.
+    """
+    return sys.intern(_split_pascal_words(name).lower())
+
+
+def _split_pascal_words(name: str) -> str:
+    """
+    Separates the words of a PascalCase identifier with underscores, keeping their case.
+
+    Words are split in a single pass over the characters. A word starts at an uppercase letter that follows a
+    lowercase letter or digit (`Step2Name` -> `Step2_Name`), or that is followed by a lowercase letter
+    (`HTTPServer` -> `HTTP_Server`).
+
+    Args:
+        name (str): The PascalCase identifier to split.
+
+    Returns:
+        str: The identifier with underscores between its words.
+    """
+    chars = []
+    last_index = len(name) - 1
+    for index, char in enumerate(name):
+        if (
+            index
+            and char in _ASCII_UPPERCASE
+            and (
+                name[index - 1] in _ASCII_LOWERCASE_OR_DIGITS
+                or (index < last_index and name[index + 1] in _ASCII_LOWERCASE)
+            )
+        ):
+            chars.append("_")
+        chars.append(char)
+    return "".join(chars)
 
 
 def snake_to_pascal(name: str, special_names_set: set) -> str:
@@ -98,7 +280,24 @@ def snake_to_pascal(name: str, special_names_set: set) -> str:
         return name
     elif name in special_names_set:
         return name
-    return "".join(x.title() for x in name.split("_"))
+    return _snake_to_pascal(name)
+
+
+@lru_cache(maxsize=4096)
+def _snake_to_pascal(name: str) -> str:
+    """
+    Converts a snake_case identifier that is not a special name to PascalCase.
+
+    The conversion is cached, as the same property names are converted for every object serialized. Results are
+    interned, so the keys of serialized objects are shared with the schema's (interned) keys.
+
+    Args:
+        name (str): The snake_case identifier to convert.
+
+    Returns:
+        str: The converted PascalCase string.
+    """
+    return sys.intern("".join(x.title() for x in name.split("_")))
 
 
 def pascal_to_screaming_snake(
@@ -127,8 +326,7 @@ def pascal_to_screaming_snake(
     elif "_" in name:
         special_names_set.add(name)
         return name
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).upper()
+    return _split_pascal_words(name).upper()
 
 
 def screaming_snake_to_pascal(
@@ -154,7 +352,40 @@ def screaming_snake_to_pascal(
         return name
     elif name in special_names_set:
         return name
-    return "".join(x.title() for x in name.split("_"))
+    return _snake_to_pascal(name)
+
+
+def parse_datetime(value: str) -> datetime.datetime:
+    """
+    Parses a datetime string, such as the ISO 8601 timestamps TRIOS exports.
+
+    ISO 8601 strings are parsed with `datetime.fromisoformat`, which is much faster than dateutil, with time zones
+    set as dateutil would set them. Other strings, and ISO 8601 variants that `fromisoformat` does not support on
+    this version of Python, are parsed with dateutil.
+
+    Args:
+        value (str): The datetime string.
+
+    Returns:
+        datetime.datetime: The parsed datetime.
+
+    Raises:
+        ValueError: If the string cannot be parsed as a datetime.
+        TypeError: If the value is not a string.
+    """
+    try:
+        if value[-1:] == "Z":
+            parsed = datetime.datetime.fromisoformat(value[:-1])
+            return parsed.replace(tzinfo=dateutil_tz.UTC)
+        parsed = datetime.datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return dateutil_parser.parse(value)
+    offset = parsed.utcoffset()
+    if offset is None:
+        return parsed
+    elif offset:
+        return parsed.replace(tzinfo=dateutil_tz.tzoffset(None, offset.total_seconds()))
+    return parsed.replace(tzinfo=dateutil_tz.UTC)
 
 
 def convert_non_json_serializable_types(obj: Any) -> str:
@@ -171,7 +402,8 @@ def convert_non_json_serializable_types(obj: Any) -> str:
         TypeError: If the object is not serializable.
     """
     if isinstance(obj, datetime.datetime):
-        return obj.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        # the time is written as is, without converting it to UTC, as strftime("%Y-%m-%dT%H:%M:%S.%fZ") would
+        return obj.replace(tzinfo=None).isoformat(timespec="microseconds") + "Z"
     elif isinstance(obj, uuid.UUID):
         return str(obj)
     raise TypeError("Type %s not serializable" % type(obj))
@@ -189,19 +421,54 @@ def split_props_by_required(definition: Dict) -> Tuple[Dict, Dict]:
         non-required properties.
     """
     properties = definition.get("properties", {})
-    required = set(definition.get("required", []))
+    required = frozenset(definition.get("required", ()))
 
-    required_props = {p: properties[p] for p in properties if p in required}
-    non_required_props = {p: properties[p] for p in properties if p not in required}
+    required_props = {}
+    non_required_props = {}
+    for p, v in properties.items():
+        (required_props if p in required else non_required_props)[p] = v
 
     return required_props, non_required_props
 
 
+def get_ref_name(ref: str) -> str:
+    """
+    Get the name of the definition that a JSON schema reference points to.
+
+    Args:
+        ref (str): The `$ref` value, e.g. `"#/$defs/Uuid"`.
+
+    Returns:
+        str: The referenced definition name, e.g. `"Uuid"`.
+    """
+    return ref.rpartition("/")[2]
+
+
+def intern_keys(obj: Any) -> Any:
+    """
+    Recursively interns the keys of every dictionary in a JSON-like structure.
+
+    Keys parsed from JSON are not interned, so membership tests such as `"$ref" in definition` fall back to
+    full string comparisons. Interning them once at load time lets these lookups resolve by identity.
+
+    Args:
+        obj (Any): The parsed JSON structure (dictionaries, lists and scalar values).
+
+    Returns:
+        Any: An equivalent structure in which all dictionary keys are interned strings.
+    """
+    if isinstance(obj, dict):
+        return {sys.intern(k): intern_keys(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [intern_keys(item) for item in obj]
+    return obj
+
+
 def copy_function(original_function: FunctionType) -> FunctionType:
     """
     Creates a copy of a given function.
 
-    This method duplicates a function, including its code, globals, name, defaults,
+    This method duplicates a function, including its code, globals, name, defaults (positional and keyword-only),
     closures, and other attributes, making a full copy that behaves like the original.
 
     Args:
@@ -217,6 +484,12 @@ def copy_function(original_function: FunctionType) -> FunctionType:
         original_function.__defaults__,
         original_function.__closure__,
     )
-    duplicate_function.__dict__.update(original_function.__dict__)
-    duplicate_function.__annotations__.update(original_function.__annotations__)
+    if original_function.__kwdefaults__:
+        duplicate_function.__kwdefaults__ = dict(original_function.__kwdefaults__)
+    # most functions have no attributes or annotations, so there is nothing to copy (and no empty annotations dict to
+    # create on the duplicate)
+    if original_function.__dict__:
+        duplicate_function.__dict__.update(original_function.__dict__)
+    if original_function.__annotations__:
+        duplicate_function.__annotations__.update(original_function.__annotations__)
     return duplicate_function
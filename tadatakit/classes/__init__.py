@@ -1,7 +1,12 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, Optional, Literal
+from itertools import chain
+from math import nan
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Literal, Tuple
 from uuid import UUID
 import warnings
+import weakref
 
 from tadatakit.class_generator import Experiment, DataSetClassificationType
 
@@ -12,6 +17,32 @@ class DataProvenanceWarning(UserWarning):
 
 warnings.simplefilter("once", DataProvenanceWarning)
 
+# the DataFrame of all results of each section cached by `get_dataframe(..., cache=True)`, with the rows it was built
+# from and their count, so repeated requests for it are not rebuilt unless rows have been replaced, added or removed
+_dataframes = weakref.WeakKeyDictionary()
+
+_SECTIONS = {
+    "original": attrgetter("original"),
+    "processed": attrgetter("processed"),
+}
+
+
+def _parse_uuids(values: List[Any]) -> List[Optional[UUID]]:
+    """
+    Converts the values of a UUID column to UUIDs.
+
+    Columns hold few distinct UUIDs (such as the ids of the procedure steps) repeated for every row, so each distinct
+    string is parsed once.
+
+    Args:
+        values (List[Any]): The values of the column.
+
+    Returns:
+        List[Optional[UUID]]: The UUIDs, with None for values that are not strings.
+    """
+    uuids = {value: UUID(value) for value in set(values) if isinstance(value, str)}
+    return [uuids.get(value) for value in values]
+
 
 def create_dataframe(
     self: Experiment,
@@ -37,38 +68,55 @@ def create_dataframe(
                       data types and units applied to the columns.
     """
     try:
-        results = getattr(self.results, section)
-    except AttributeError as e:
+        results = _SECTIONS[section](self.results)
+    except (KeyError, AttributeError) as e:
         raise ValueError(
             f"Section '{section}' does not exist in the Experiment instance."
         ) from e
 
     column_dtypes: Dict[str, str] = {}
     column_names: Dict[str, str] = {}
+    uuid_columns = set()
+
+    for col, details in results.column_headers.__dict__.items():
+        value_type = details.value_type
+        column_dtypes[col] = "float64" if value_type == "Number" else "object"
+        if value_type == "Uuid":
+            uuid_columns.add(col)
+        unit_name = details.unit.name if details.unit is not None else None
+        column_names[col] = (
+            details.display_name
+            if unit_name is None
+            else f"{details.display_name} / {unit_name}"
+        )
 
-    for col, details in results.column_headers.to_dict().items():
-        column_dtypes[col] = "float64" if details["ValueType"] == "Number" else "object"
-        unit_dict = details.get("Unit")
-        unit_name = unit_dict["Name"] if unit_dict else None
-        column_names[col] = details["DisplayName"]
-        if unit_name is not None:
-            column_names[col] += f" / {unit_name}"
-
-    df = pd.DataFrame([row.__dict__ for row in results.rows[start_index:end_index]])
-    df = df.astype({c: column_dtypes[c] for c in df.columns})
-
-    def uuid_converter(x):
-        if isinstance(x, str):
-            return UUID(x)
+    # build each column from the rows' values directly, in the order columns first appear in the rows (as pandas
+    # would order them), rather than building the frame row by row and casting it afterwards
+    rows = [row.__dict__ for row in results.rows[start_index:end_index]]
+    columns = {}
+    # bound locally, as it is read once per value
+    missing = nan
+    for column in dict.fromkeys(chain.from_iterable(rows)):
+        dtype = column_dtypes[column]
+        if dtype == "float64":
+            # numbers are read straight into a float array, unless the column holds values (such as None) that only
+            # pandas converts
+            try:
+                values = np.fromiter(
+                    (row.get(column, missing) for row in rows),
+                    dtype=np.float64,
+                    count=len(rows),
+                )
+            except TypeError:
+                values = [row.get(column, missing) for row in rows]
         else:
-            return None
-
-    for uuid_column in [
-        k
-        for k, v in results.column_headers.to_dict().items()
-        if v["ValueType"] == "Uuid"
-    ]:
-        df[uuid_column] = df[uuid_column].apply(uuid_converter)
+            values = [row.get(column, missing) for row in rows]
+            if column in uuid_columns:
+                values = _parse_uuids(values)
+        columns[column] = pd.Series(values, dtype=dtype, copy=False)
+    # the columns are new, so the frame can take them over without copying them, and is then labelled in place
+    df = pd.DataFrame(columns, copy=False)
+    df.columns = [column_names.get(column, column) for column in df.columns]
 
     if (
         section == "original"
@@ -79,48 +127,127 @@ def create_dataframe(
             DataProvenanceWarning,
             stacklevel=2,
         )
-    return df.rename(columns=column_names)
+    return df
+
+
+def _get_cached_dataframe(
+    self: Experiment,
+    section: Literal["original", "processed"] = "original",
+) -> pd.DataFrame:
+    """
+    Retrieves the DataFrame of all results of a section, building it only if it has not been built yet or the rows
+    of the section have been replaced, added or removed since.
+
+    Args:
+        section (Literal["original", "processed"]): The name of the section to retrieve.
+
+    Returns:
+        pd.DataFrame: The cached DataFrame, which must not be modified.
+    """
+    results = getattr(self.results, section, None)
+    cached = _dataframes.get(results) if results is not None else None
+    if (
+        cached is not None
+        and cached[0] is results.rows
+        and cached[1] == len(results.rows)
+    ):
+        return cached[2]
+    df = create_dataframe(self, section, None, None)
+    _dataframes[results] = (results.rows, len(results.rows), df)
+    return df
 
 
 def get_dataframe(
     self: Experiment,
     section: Literal["original", "processed"] = "original",
+    cache: bool = False,
 ) -> pd.DataFrame:
     """
     Retrieves a DataFrame containing all results from the Experiment.
 
+    By default the DataFrame is built on every call. With `cache`, it is built once per section and kept for as long
+    as the Experiment is, and a copy of it is returned on later calls that also set `cache`. The cached DataFrame is
+    rebuilt when the section's rows are replaced by another list, or rows are added to or removed from it, but not
+    when rows are modified in place. Calling without `cache` discards any cached DataFrame of the section, so such
+    modifications are picked up by later calls.
+
     Args:
         section (Literal["original", "processed"]): The name of the section to retrieve.
+        cache (bool): Whether to keep the DataFrame and reuse it on later calls. Defaults to False.
 
     Returns:
         pd.DataFrame: A DataFrame containing all results of the Experiment.
     """
+    if cache:
+        return _get_cached_dataframe(self, section).copy()
+    results = getattr(self.results, section, None)
+    if results is not None:
+        _dataframes.pop(results, None)
     return create_dataframe(self, section, None, None)
 
 
+def _step_positions(df: pd.DataFrame) -> Dict[UUID, np.ndarray]:
+    """
+    Finds the positions of the rows of each procedure step in a DataFrame of results, as grouping by step id would.
+
+    Rows are grouped by the identity of their step id rather than its value, which needs no Python-level hashing of
+    UUIDs, as `create_dataframe` creates one UUID per distinct step id. Groups of equal step ids are then merged, so
+    the result does not depend on that.
+
+    Args:
+        df (pd.DataFrame): The DataFrame of results, with a "Procedure Step Id" column.
+
+    Returns:
+        Dict[UUID, np.ndarray]: The ascending positions of the rows of each step, by step id. Rows without a step id
+                                (None or NaN) are left out.
+    """
+    step_ids = df["Procedure Step Id"].to_numpy()
+    identities = np.fromiter(map(id, step_ids), dtype=np.intp, count=len(step_ids))
+    positions_by_step: Dict[UUID, np.ndarray] = {}
+    for positions in df.groupby(identities, sort=False).indices.values():
+        step_id = step_ids[positions[0]]
+        if pd.isna(step_id):
+            continue
+        elif step_id in positions_by_step:
+            positions = np.sort(np.concatenate([positions_by_step[step_id], positions]))
+        positions_by_step[step_id] = positions
+    return positions_by_step
+
+
 def get_dataframes_by_step(
     self: Experiment,
     section: Literal["original", "processed"] = "original",
-) -> Dict[str, pd.DataFrame]:
+    cache: bool = False,
+) -> Tuple[List[str], List[pd.DataFrame]]:
     """
-    Generates a dictionary of pandas DataFrames, each representing the results of a
-    specific step in the Experiment.
+    Generates pandas DataFrames, each representing the results of a specific step in the
+    Experiment.
 
     This method organizes the experiment results into separate DataFrames for each step
     based on the "Procedure Step Id".
 
     Args:
         section (Literal["original", "processed"]): The name of the section to retrieve.
+        cache (bool): Whether to keep the DataFrame of all results and reuse it on later calls, as `get_dataframe`
+                      does. Defaults to False.
 
     Returns:
-        Dict[str, pd.DataFrame]: A dictionary where the keys are step names and the values are DataFrames
-                                 containing the results for each respective step.
+        Tuple[List[str], List[pd.DataFrame]]: The names of the steps of the procedure, and a DataFrame for each
+                                              containing the results of the step, in the same order. The DataFrame
+                                              of a step without results is empty.
     """
-    df = self.get_dataframe(section)
-    df_dict = {k: v for k, v in df.groupby("Procedure Step Id")}
+    # each step's rows are taken from the DataFrame of all results, which makes new frames, so a cached DataFrame is
+    # not copied first, and only the steps of the procedure are taken
+    df = _get_cached_dataframe(self, section) if cache else self.get_dataframe(section)
+    positions_by_step = _step_positions(df)
     steps = [step.name for step in self.procedure.steps]
     return steps, [
-        df_dict.get(step.id, pd.DataFrame()) for step in self.procedure.steps
+        (
+            df.take(positions_by_step[step.id])
+            if step.id in positions_by_step
+            else pd.DataFrame()
+        )
+        for step in self.procedure.steps
     ]
 
 
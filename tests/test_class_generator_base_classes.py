@@ -1,11 +1,19 @@
 import pytest
 import json
+import math
+import inspect
 from datetime import datetime
 from uuid import UUID
 from io import StringIO
 from enum import Enum
+from typing import Optional, Union
 
-from tadatakit.class_generator.base_classes import SchemaObject, IdDescriptionEnum
+from tadatakit.class_generator import base_classes
+from tadatakit.class_generator.base_classes import (
+    SchemaObject,
+    IdDescriptionEnum,
+    PropertyDetails,
+)
 
 
 @pytest.fixture
@@ -56,6 +64,38 @@ def test__dynamic_property_addition__must_add_properties_correctly(
     assert isinstance(instance.uuid_property, UUID)
 
 
+def test__add_property__must_store_property_details(dynamic_schema_class):
+    details = dynamic_schema_class._added_properties["integer_property"]
+    assert isinstance(details, PropertyDetails)
+    assert details.caster is int
+    assert details.type_hint is int
+    assert details.default is inspect.Parameter.empty
+
+
+def test__add_properties__must_add_properties_in_order__when_added_together(
+    mocker,
+):
+    class Batch(SchemaObject):
+        pass
+
+    spy = mocker.spy(Batch, "_update_init")
+    Batch._add_properties(
+        {
+            "name": PropertyDetails(str, str, inspect.Parameter.empty),
+            "count": PropertyDetails(int, Optional[int], None),
+        }
+    )
+    assert spy.call_count == 1
+    assert list(inspect.signature(Batch.__init__).parameters) == [
+        "self",
+        "name",
+        "count",
+    ]
+    instance = Batch(name="n", count="3")
+    assert instance.count == 3
+    assert Batch(name="n").count is None
+
+
 def test__SchemaObject_init__must_raise_error__when_missing_required_properties(
     dynamic_schema_class,
 ):
@@ -64,6 +104,80 @@ def test__SchemaObject_init__must_raise_error__when_missing_required_properties(
         dynamic_schema_class(string_property="value", integer_property=100)
 
 
+def test__SchemaObject_init__must_be_generated_on_first_instantiation(
+    dynamic_schema_class, schema_data
+):
+    signature = inspect.signature(dynamic_schema_class.__init__)
+    instance = dynamic_schema_class(**schema_data)
+    assert dynamic_schema_class.__init__.__code__.co_filename.startswith("<generated")
+    assert inspect.signature(dynamic_schema_class.__init__) == signature
+    assert instance.integer_property == 42
+    assert instance.uuid_property == UUID(schema_data["uuid_property"])
+
+
+def test__SchemaObject_init__must_be_named_after_class(
+    dynamic_schema_class, schema_data
+):
+    assert dynamic_schema_class.__init__.__qualname__.endswith("TestSchema.__init__")
+    dynamic_schema_class(**schema_data)
+    assert dynamic_schema_class.__init__.__qualname__.endswith("TestSchema.__init__")
+    assert dynamic_schema_class.__init__.__doc__.startswith(
+        "Initialize a TA Instruments `TestSchema` object."
+    )
+
+
+def test__SchemaObject_init__must_share_code__when_classes_have_same_properties():
+    class First(SchemaObject):
+        pass
+
+    class Second(SchemaObject):
+        pass
+
+    First._add_property("value", int, int)
+    Second._add_property("value", str, str)
+    first, second = First(value="1"), Second(value=1)
+    assert First.__init__.__code__ is Second.__init__.__code__
+    assert first.value == 1
+    assert second.value == "1"
+
+
+def test__SchemaObject_init__must_raise_error__when_value_cannot_be_cast(
+    dynamic_schema_class, schema_data
+):
+    schema_data["integer_property"] = "forty-two"
+    with pytest.raises(TypeError, match="Argument 'integer_property'"):
+        dynamic_schema_class(**schema_data)
+
+
+def test__SchemaObject_init__must_cast_value__when_property_is_named_after_builtin():
+    class Named(SchemaObject):
+        pass
+
+    Named._add_property("type", int, Optional[int], default=None)
+    assert Named(type=1).type == 1
+    assert Named(type="2").type == 2
+
+
+def test__SchemaObject_init__must_cast_additional_properties__when_not_of_union_types():
+    class Row(SchemaObject):
+        pass
+
+    Row._add_additional_properties(float, Union[float, bool, str])
+    row = Row(a=1.5, b=True, c="x", d=2)
+    assert row.__dict__ == {"a": 1.5, "b": True, "c": "x", "d": 2.0}
+    assert type(row.d) is float
+
+
+def test__SchemaObject_init__must_store_additional_properties__when_of_any_type():
+    class Extensible(SchemaObject):
+        pass
+
+    Extensible._add_property("name", str, str)
+    Extensible._add_additional_properties()
+    instance = Extensible(name="n", extra={"a": 1}, other=None)
+    assert instance.__dict__ == {"name": "n", "extra": {"a": 1}, "other": None}
+
+
 def test__to_dict__must_convert_instance_to_dict(dynamic_schema_class, schema_data):
     instance = dynamic_schema_class(**schema_data)
     result = instance.to_dict()
@@ -74,6 +188,17 @@ def test__to_dict__must_convert_instance_to_dict(dynamic_schema_class, schema_da
     assert "UuidProperty" in result
 
 
+def test__to_dict__must_convert_each_property_name_once(
+    mocker, dynamic_schema_class, schema_data
+):
+    spy = mocker.spy(base_classes, "snake_to_pascal")
+    instance = dynamic_schema_class(**schema_data)
+    instance.to_dict()
+    result = instance.to_dict()
+    assert spy.call_count == len(schema_data)
+    assert result["StringProperty"] == "test"
+
+
 def test__to_json__must_convert_instance_to_json(dynamic_schema_class, schema_data):
     instance = dynamic_schema_class(**schema_data)
     buffer = StringIO()
@@ -91,6 +216,67 @@ def test__from_dict__must_create_instance_from_dict(dynamic_schema_class, schema
     assert instance.integer_property == 42
 
 
+def test__from_dict__must_document_subclass__when_accessed(dynamic_schema_class):
+    class Derived(dynamic_schema_class):
+        pass
+
+    assert "TestSchema" in dynamic_schema_class.from_dict.__doc__
+    assert "Derived" in Derived.from_dict.__doc__
+    assert Derived.from_json.__annotations__["return"] == "Derived"
+    assert isinstance(Derived.__dict__["from_dict"], classmethod)
+    assert "SchemaObject" in SchemaObject.from_dict.__doc__
+
+
+def test__from_dict__must_keep_override__when_inherited_from_base_class():
+    class Parent(SchemaObject):
+        @classmethod
+        def from_dict(cls, data):
+            """Creates a SchemaObject from overridden data."""
+            return ("overridden", cls)
+
+    class Child(Parent):
+        pass
+
+    assert Parent.from_dict({}) == ("overridden", Parent)
+    assert Child.from_dict({}) == ("overridden", Child)
+    assert Child.from_dict.__doc__ == "Creates a Child from overridden data."
+
+    class GrandChild(Child):
+        pass
+
+    assert GrandChild.from_dict({}) == ("overridden", GrandChild)
+    assert GrandChild.from_dict.__doc__ == "Creates a GrandChild from overridden data."
+    assert "GrandChild" in GrandChild.from_json.__doc__
+
+
+def test__from_dict__must_keep_override__when_override_calls_super():
+    class Parent(SchemaObject):
+        @classmethod
+        def from_dict(cls, data):
+            return {"cls": cls}
+
+    class Child(Parent):
+        @classmethod
+        def from_dict(cls, data):
+            result = super().from_dict(data)
+            result["tagged"] = True
+            return result
+
+    assert Child.from_dict({}) == {"cls": Child, "tagged": True}
+    assert Child.from_dict({}) == {"cls": Child, "tagged": True}
+    assert Parent.from_dict({}) == {"cls": Parent}
+
+
+def test__from_dict__must_convert_each_key_once(
+    mocker, dynamic_schema_class, schema_data
+):
+    spy = mocker.spy(base_classes, "pascal_to_snake")
+    dynamic_schema_class.from_dict(schema_data)
+    instance = dynamic_schema_class.from_dict(schema_data)
+    assert spy.call_count == len(schema_data)
+    assert instance.string_property == "test"
+
+
 def test__from_json__must_create_instance_from_json(dynamic_schema_class, schema_data):
     json_data = json.dumps(schema_data)
     buffer = StringIO(json_data)
@@ -99,6 +285,22 @@ def test__from_json__must_create_instance_from_json(dynamic_schema_class, schema
     assert instance.integer_property == 42
 
 
+def test__from_json__must_parse_non_finite_numbers(dynamic_schema_class, schema_data):
+    schema_data["float_property"] = float("nan")
+    instance = dynamic_schema_class.from_json(StringIO(json.dumps(schema_data)))
+    assert math.isnan(instance.float_property)
+
+
+def test__from_json__must_read_file__when_orjson_is_not_installed(
+    mocker, tmp_path, dynamic_schema_class, schema_data
+):
+    mocker.patch("tadatakit.class_generator.base_classes.orjson", None)
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(schema_data))
+    instance = dynamic_schema_class.from_json(path)
+    assert instance.integer_property == 42
+
+
 @pytest.fixture
 def sample_enum():
     return Enum(
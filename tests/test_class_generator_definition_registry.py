@@ -1,4 +1,11 @@
+import gc
 import pytest
+import json
+import sys
+import typing
+import weakref
+from io import StringIO
+from tadatakit.class_generator import utils
 from tadatakit.class_generator.definition_registry import (
     DefinitionRegistry,
     DefinitionUnidentifiedError,
@@ -59,20 +66,26 @@ def test__init__must_include_simple_schema__when_provided_with_simple_schema(
 
 
 def test__from_json__must_initialize_registry__when_json_file_is_valid(
-    mocker, simple_schema
+    tmp_path, simple_schema
 ):
-    mocker.patch("json.load", return_value=simple_schema)
-    mocker.patch("builtins.open", mocker.mock_open())
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(simple_schema))
 
-    registry = DefinitionRegistry.from_json("path/to/schema.json")
+    registry = DefinitionRegistry.from_json(str(path))
     assert "SimpleSchema" in registry._type_hints
 
 
-def test__from_json__must_raise_error__when_file_is_invalid(mocker):
-    mocker.patch("builtins.open", side_effect=IOError)
+def test__from_json__must_intern_schema_keys(mocker, simple_schema):
+    spy = mocker.spy(DefinitionRegistry, "__init__")
+    DefinitionRegistry.from_json(StringIO(json.dumps(simple_schema)))
+    schema = spy.call_args.args[1]
+    assert schema == simple_schema
+    assert all(key is sys.intern(key) for key in schema["properties"])
 
+
+def test__from_json__must_raise_error__when_file_is_invalid(tmp_path):
     with pytest.raises(IOError):
-        DefinitionRegistry.from_json("path/to/nonexistent/file.json")
+        DefinitionRegistry.from_json(tmp_path / "nonexistent" / "file.json")
 
 
 def test__init__must_raise_error__when_schema_is_invalid(invalid_schema):
@@ -134,3 +147,65 @@ def test__parse__must_identify_nested_structures(complex_schema):
     registry = DefinitionRegistry(complex_schema)
     assert registry._type_hints["Person"]
     assert registry._type_hints["Employee"]
+
+
+def test__create_type_hint_and_caster__must_share_caster__when_arrays_reference_same_definition(
+    complex_schema,
+):
+    registry = DefinitionRegistry(complex_schema)
+    array_definition = {"type": "array", "items": {"$ref": "#/$defs/Person"}}
+    first = registry._create_type_hint_and_caster(dict(array_definition), "First")
+    second = registry._create_type_hint_and_caster(dict(array_definition), "Second")
+    assert first[0] is second[0]
+    assert first[1] is second[1]
+
+
+def test__identify_definition_type__must_classify_each_definition_once(
+    mocker, complex_schema
+):
+    registry = DefinitionRegistry(complex_schema)
+    classify = mocker.spy(DefinitionRegistry, "_classify_definition")
+    person = complex_schema["$defs"]["Person"]
+    assert registry._identify_definition_type(person) == "custom"
+    assert registry._identify_definition_type(person) == "custom"
+    assert classify.call_count == 1
+
+
+def test__init__must_not_modify_schema_definitions(complex_schema):
+    definition_names = list(complex_schema["$defs"])
+    DefinitionRegistry(complex_schema)
+    assert list(complex_schema["$defs"]) == definition_names
+
+
+def test__add_custom_types_from_props__must_create_one_class_per_nested_object(
+    complex_schema,
+):
+    complex_schema["$defs"]["Person"]["properties"]["Address"] = {
+        "type": "object",
+        "properties": {"Street": {"type": "string"}},
+    }
+    registry = DefinitionRegistry(complex_schema)
+    custom_definitions = registry._definition_groups["custom"]
+    assert len(custom_definitions) == len(set(custom_definitions))
+    address_class = registry._type_hints["Person_Address"]
+    person = registry._type_hints["Person"].from_dict(
+        {"Name": "Alice", "Address": {"Street": "Main Street"}}
+    )
+    assert isinstance(person.address, address_class)
+    assert person.address.street == "Main Street"
+
+
+def test__init__must_not_keep_classes_of_previous_registry_alive(complex_schema):
+    first = DefinitionRegistry(complex_schema)
+    second = DefinitionRegistry(complex_schema)
+    first_classes = [weakref.ref(cls) for cls in first._type_hints.values()]
+    assert first._type_hints["Employee"] is not second._type_hints["Employee"]
+    del first
+    # clear the other caches of type hints, which keep the classes until they are evicted
+    utils.get_type_checker.cache_clear()
+    utils.get_exact_types.cache_clear()
+    for cleanup in typing._cleanups:
+        cleanup()
+    gc.collect()
+    assert all(cls() is None for cls in first_classes)
+    assert utils.type_hint_to_str(second._type_hints["Employee"]) == "Employee"
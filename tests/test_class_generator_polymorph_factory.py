@@ -66,3 +66,78 @@ def test__discriminate__must_raise_error__when_no_condition_matches(
     with pytest.raises(ValueError) as exc_info:
         factory.discriminate({"role": "intern"})
     assert "Data does not match any conditions" in str(exc_info.value)
+
+
+def test__discriminate__must_return_first_matching_instance__when_conditions_use_different_properties(
+    mock_registry,
+):
+    factory = PolymorphFactory(
+        mock_registry,
+        {
+            "allOf": [
+                {
+                    "if": {"properties": {"level": {"const": "senior"}}},
+                    "then": {"$ref": "#/definitions/Manager"},
+                },
+                {
+                    "if": {"properties": {"role": {"const": "employee"}}},
+                    "then": {"$ref": "#/definitions/Employee"},
+                },
+            ]
+        },
+    )
+    assert factory._dispatch_table is None
+    result = factory.discriminate({"role": "employee", "level": "senior"})
+    assert result == "Manager instance created"
+    result = factory.discriminate({"role": "employee"})
+    assert result == "Employee instance created"
+
+
+def test__discriminate__must_raise_error__when_discriminator_value_is_unhashable(
+    mock_registry, conditions_schema
+):
+    factory = PolymorphFactory(mock_registry, conditions_schema)
+    with pytest.raises(ValueError):
+        factory.discriminate({"role": ["employee"]})
+
+
+def test__discriminate__must_use_caster__when_caster_is_registered_after_creation(
+    mocker, mock_registry, conditions_schema
+):
+    del mock_registry._casters["Manager"]
+    factory = PolymorphFactory(mock_registry, conditions_schema)
+    mock_registry._casters["Manager"] = mocker.MagicMock(return_value="Late manager")
+    assert factory.discriminate({"role": "manager"}) == "Late manager"
+
+
+def test__discriminate__must_try_last_matched_condition_first__when_conditions_are_exclusive(
+    mocker, mock_registry
+):
+    factory = PolymorphFactory(
+        mock_registry,
+        {
+            "allOf": [
+                {
+                    "if": {"properties": {"role": {"const": "employee"}}},
+                    "then": {"$ref": "#/definitions/Employee"},
+                },
+                {
+                    "if": {
+                        "properties": {
+                            "role": {"const": "manager"},
+                            "level": {"const": "senior"},
+                        }
+                    },
+                    "then": {"$ref": "#/definitions/Manager"},
+                },
+            ]
+        },
+    )
+    assert factory._dispatch_table is None
+    assert factory._conditions_exclusive
+    data = {"role": "manager", "level": "senior"}
+    assert factory.discriminate(data) == "Manager instance created"
+    spy = mocker.spy(PolymorphFactory, "_condition_matches")
+    assert factory.discriminate(data) == "Manager instance created"
+    assert spy.call_count == 1
+    assert factory.discriminate({"role": "employee"}) == "Employee instance created"
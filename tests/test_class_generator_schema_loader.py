@@ -0,0 +1,21 @@
+from tadatakit.class_generator.schema_loader import load_schema
+
+
+def test__load_schema__must_return_schema():
+    schema = load_schema()
+    assert schema["title"] == "Experiment"
+    assert "$defs" in schema
+
+
+def test__load_schema__must_return_cached_schema__when_called_again():
+    assert load_schema() is load_schema()
+
+
+def test__load_schema__must_fall_back_to_json__when_orjson_is_unavailable(mocker):
+    mocker.patch("tadatakit.class_generator.schema_loader.orjson", None)
+    cached_schema = load_schema()
+    load_schema.cache_clear()
+    try:
+        assert load_schema() == cached_schema
+    finally:
+        load_schema.cache_clear()
@@ -1,11 +1,15 @@
 import pytest
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta, timezone
+from dateutil import parser as dateutil_parser, tz
 from uuid import UUID
-from typing import Union, List
+from typing import Any, Optional, Union, List
 
 from tadatakit.class_generator.utils import (
     type_hint_to_str,
     is_instance,
+    get_type_checker,
+    get_exact_types,
     pascal_to_snake,
     snake_to_pascal,
     pascal_to_screaming_snake,
@@ -13,6 +17,9 @@ from tadatakit.class_generator.utils import (
     convert_non_json_serializable_types,
     split_props_by_required,
     copy_function,
+    intern_keys,
+    parse_datetime,
+    get_ref_name,
 )
 
 
@@ -23,6 +30,8 @@ from tadatakit.class_generator.utils import (
         (int, "int"),
         (datetime, "datetime"),
         (Union[str, int], "Union[str, int]"),
+        (Optional[int], "Optional[int]"),
+        (Optional[List[datetime]], "Optional[List[datetime]]"),
     ],
 )
 def test__type_hint_to_str__must_convert_type_hint_to_string(type_hint, expected):
@@ -51,12 +60,88 @@ def test__is_instance__must_raise_type_error__when_type_hint_is_invalid():
 
 
 @pytest.mark.parametrize(
-    "pascal, snake", [("PascalCase", "pascal_case"), ("TestCase", "test_case")]
+    "obj, type_hint, expected",
+    [
+        (123, int, True),
+        ([1, 2, 3], List[int], True),
+        ([1, "2"], List[int], False),
+        ([1], Optional[List[int]], True),
+        ("abc", Union[int, str], True),
+        (1.5, Union[int, str], False),
+        (None, Optional[int], True),
+        ([1], Union[int, List[int]], True),
+        (["1"], Union[int, List[int]], False),
+        ("abc", Union[int, Any], True),
+        (object(), Any, True),
+    ],
+)
+def test__get_type_checker__must_agree_with_is_instance(obj, type_hint, expected):
+    assert get_type_checker(type_hint)(obj) == expected == is_instance(obj, type_hint)
+
+
+def test__get_type_checker__must_cache_checker_per_type_hint():
+    assert get_type_checker(List[int]) is get_type_checker(List[int])
+
+
+def test__get_type_checker__must_bound_cache():
+    assert get_type_checker.cache_info().maxsize is not None
+
+
+def test__get_type_checker__must_raise_type_error__when_type_hint_is_invalid():
+    with pytest.raises(TypeError):
+        get_type_checker("not_a_type")(123)
+
+
+@pytest.mark.parametrize(
+    "type_hint, expected",
+    [
+        (int, {int}),
+        (Optional[str], {str}),
+        (Union[int, str], {int, str}),
+        (Optional[List[int]], set()),
+        (List[int], set()),
+        (Any, set()),
+    ],
+)
+def test__get_exact_types__must_return_classes_matching_type_hint(type_hint, expected):
+    assert get_exact_types(type_hint) == expected
+
+
+def test__get_exact_types__must_bound_cache__like_get_type_checker():
+    maxsize = get_exact_types.cache_info().maxsize
+    assert maxsize is not None
+    assert maxsize == get_type_checker.cache_info().maxsize
+
+
+@pytest.mark.parametrize(
+    "pascal, snake",
+    [
+        ("PascalCase", "pascal_case"),
+        ("TestCase", "test_case"),
+        ("HTTPServer", "http_server"),
+        ("SampleIDs", "sample_i_ds"),
+        ("Step2Name", "step2_name"),
+        ("Id", "id"),
+    ],
 )
 def test__pascal_to_snake__must_convert_pascal_case_to_snake_case(pascal, snake):
     assert pascal_to_snake(pascal, set()) == snake
 
 
+def test__pascal_to_snake__must_record_special_names__when_conversion_is_cached():
+    pascal_to_snake("Already_Snake", set())
+    special_names_set = set()
+    assert pascal_to_snake("Already_Snake", special_names_set) == "Already_Snake"
+    assert special_names_set == {"Already_Snake"}
+
+
+def test__case_conversions__must_return_interned_strings():
+    snake = pascal_to_snake("".join(["Interned", "Property", "Name"]), set())
+    pascal = snake_to_pascal("_".join(["interned", "other", "name"]), set())
+    assert snake is sys.intern("interned_property_name")
+    assert pascal is sys.intern("InternedOtherName")
+
+
 @pytest.mark.parametrize(
     "snake, pascal", [("snake_case", "SnakeCase"), ("test_case", "TestCase")]
 )
@@ -94,11 +179,39 @@ def test__screaming_snake_to_pascal__must_convert_snake_case_to_pascal_case(
     assert screaming_snake_to_pascal(screaming_snake, set()) == pascal
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2020-01-01T00:00:00Z",
+        "2021-03-04T05:06:07.891011Z",
+        "2020-01-01T00:00:00.5+02:00",
+        "2020-01-01 10:11",
+        "Jan 5 2020",
+    ],
+)
+def test__parse_datetime__must_agree_with_dateutil(value):
+    assert parse_datetime(value) == dateutil_parser.parse(value)
+
+
+def test__parse_datetime__must_use_dateutil_utc__when_timestamp_ends_with_z():
+    assert parse_datetime("2020-01-01T00:00:00.000Z").tzinfo is tz.UTC
+
+
+def test__parse_datetime__must_raise_value_error__when_value_is_not_a_datetime():
+    with pytest.raises(ValueError):
+        parse_datetime("not a datetime")
+
+
 def test__convert_non_json_serializable_types__must_serialize_datetime():
     dt = datetime(2020, 1, 1, 12, 0)
     assert convert_non_json_serializable_types(dt) == "2020-01-01T12:00:00.000000Z"
 
 
+def test__convert_non_json_serializable_types__must_serialize_datetime__when_timezone_aware():
+    dt = datetime(2020, 1, 1, 12, 0, 0, 500, tzinfo=timezone(timedelta(hours=2)))
+    assert convert_non_json_serializable_types(dt) == "2020-01-01T12:00:00.000500Z"
+
+
 def test__convert_non_json_serializable_types__must_serialize_uuid():
     uid = UUID("12345678123456781234567812345678")
     assert (
@@ -123,6 +236,27 @@ def test__split_props_by_required__must_separate_required_and_non_required_prope
     assert "name" not in non_required_props
 
 
+@pytest.mark.parametrize(
+    "ref, name",
+    [
+        ("#/$defs/Uuid", "Uuid"),
+        ("#/definitions/Employee", "Employee"),
+        ("Plain", "Plain"),
+    ],
+)
+def test__get_ref_name__must_return_referenced_definition_name(ref, name):
+    assert get_ref_name(ref) == name
+
+
+def test__intern_keys__must_intern_nested_dictionary_keys():
+    key = "".join(["Nested", "Key"])
+    data = {"Outer": [{key: {"Inner": 1}}]}
+    result = intern_keys(data)
+    assert result == data
+    interned_key = next(iter(result["Outer"][0]))
+    assert interned_key is sys.intern("NestedKey")
+
+
 def create_complex_function():
     x = 10
 
@@ -159,3 +293,14 @@ def test__copy_function__must_copy_complex_function():
             original_function.__closure__ is None
             and copied_function.__closure__ is None
         )
+
+
+def test__copy_function__must_copy_keyword_only_defaults():
+    def function(a, *, scale=2, **kwargs):
+        return a * scale
+
+    copied_function = copy_function(function)
+    assert copied_function(3) == 6
+    assert copied_function.__kwdefaults__ == {"scale": 2}
+    copied_function.__kwdefaults__["scale"] = 3
+    assert function(3) == 6
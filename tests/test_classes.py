@@ -0,0 +1,259 @@
+import numpy as np
+import pandas as pd
+import pytest
+from types import SimpleNamespace
+from uuid import UUID
+
+from tadatakit import classes
+from tadatakit.classes import (
+    _step_positions,
+    create_dataframe,
+    get_dataframe,
+    get_dataframes_by_step,
+)
+from tadatakit.class_generator import (
+    DataSet,
+    DataSet_ColumnHeaders,
+    DataSetColumnHeader,
+    DataSetRow_Item,
+    DataSetClassificationType,
+    ProcedureStep,
+    Results,
+    Unit,
+)
+
+STEP_COLUMN = "e4b06ce6-0741-c7a8-7ce4-2c8218072e8c"
+TIME_COLUMN = "9b810e76-6ec9-d286-63ca-828dd5f4b3b2"
+NOTE_COLUMN = "cd447e35-b8b6-d8fe-442e-3d437204e52d"
+
+STEP_A = "cd613e30-d8f1-6adf-91b7-584a2265b1f5"
+STEP_B = "5b1d0c4e-8f2a-4c53-9a1e-2f0f7e3c9d11"
+STEP_C = "0f3e2d1c-4b5a-4978-8a6b-5c4d3e2f1a0b"
+STEP_UNLISTED = "9a8b7c6d-5e4f-4a3b-8c2d-1e0f9a8b7c6d"
+
+
+def make_experiment(rows, headers=None, steps=()):
+    if headers is None:
+        headers = {
+            STEP_COLUMN: DataSetColumnHeader(
+                display_name="Procedure Step Id", value_type="Uuid"
+            ),
+            TIME_COLUMN: DataSetColumnHeader(
+                display_name="Time", value_type="Number", unit=Unit(name="s")
+            ),
+            NOTE_COLUMN: DataSetColumnHeader(display_name="Note", value_type="Text"),
+        }
+    original = DataSet(
+        classification=DataSetClassificationType.UNMODIFIED,
+        results_steps=[],
+        column_headers=DataSet_ColumnHeaders(**headers),
+        rows=[DataSetRow_Item(**row) for row in rows],
+    )
+    experiment = SimpleNamespace(
+        results=Results(original=original),
+        procedure=SimpleNamespace(
+            steps=[
+                ProcedureStep(name=f"Step {index}", id=UUID(step_id))
+                for index, step_id in enumerate(steps)
+            ]
+        ),
+    )
+    experiment.get_dataframe = lambda *args, **kwargs: get_dataframe(
+        experiment, *args, **kwargs
+    )
+    return experiment
+
+
+@pytest.fixture
+def interleaved_rows():
+    step_ids = [STEP_A, STEP_A, None, STEP_B, STEP_A, STEP_UNLISTED, None, STEP_B]
+    return [
+        {STEP_COLUMN: step_id, TIME_COLUMN: float(index), NOTE_COLUMN: f"row {index}"}
+        for index, step_id in enumerate(step_ids)
+    ]
+
+
+def test__get_dataframes_by_step__must_match_split_by_step_id_value(interleaved_rows):
+    step_ids = [STEP_B, STEP_A, STEP_UNLISTED]
+    experiment = make_experiment(interleaved_rows, steps=step_ids)
+    df = get_dataframe(experiment)
+    names, frames = get_dataframes_by_step(experiment)
+    assert names == ["Step 0", "Step 1", "Step 2"]
+    for step_id, frame in zip(step_ids, frames):
+        expected = df[df["Procedure Step Id"] == UUID(step_id)]
+        pd.testing.assert_frame_equal(frame, expected)
+        assert list(frame.columns) == ["Procedure Step Id", "Time / s", "Note"]
+
+
+def test__get_dataframes_by_step__must_return_empty_frame__when_step_has_no_results(
+    interleaved_rows,
+):
+    experiment = make_experiment(interleaved_rows, steps=[STEP_C])
+    names, frames = get_dataframes_by_step(experiment)
+    assert names == ["Step 0"]
+    assert frames[0].empty
+
+
+def test__get_dataframes_by_step__must_leave_out_rows_without_step_id(
+    interleaved_rows,
+):
+    experiment = make_experiment(
+        interleaved_rows, steps=[STEP_A, STEP_B, STEP_UNLISTED]
+    )
+    _, frames = get_dataframes_by_step(experiment)
+    indices = sorted(np.concatenate([frame.index for frame in frames]))
+    assert indices == [0, 1, 3, 4, 5, 7]
+
+
+def test__step_positions__must_group_equal_step_ids__when_objects_differ():
+    # a new UUID object for every row, with rows missing a step id as None or NaN
+    step_ids = [UUID(STEP_A), UUID(STEP_B), None, UUID(STEP_A), UUID(STEP_B)]
+    step_ids += [UUID(STEP_A), np.nan, UUID(STEP_A)]
+    df = pd.DataFrame(
+        {
+            "Procedure Step Id": pd.Series(step_ids, dtype=object),
+            "Time": np.arange(8, dtype=float),
+        }
+    )
+    df.index = [17, 16, 15, 14, 13, 12, 11, 10]
+    positions_by_step = _step_positions(df)
+    assert set(positions_by_step) == {UUID(STEP_A), UUID(STEP_B)}
+    for step_id, positions in positions_by_step.items():
+        expected = df[df["Procedure Step Id"] == step_id]
+        np.testing.assert_array_equal(
+            positions, np.flatnonzero(df.index.isin(expected.index))
+        )
+        pd.testing.assert_frame_equal(df.take(positions), expected)
+
+
+def test__get_dataframe__must_build_new_dataframe__when_not_cached(
+    mocker, interleaved_rows
+):
+    experiment = make_experiment(interleaved_rows)
+    spy = mocker.spy(classes, "create_dataframe")
+    first = get_dataframe(experiment)
+    experiment.results.original.rows[0].__dict__[TIME_COLUMN] = -1.0
+    second = get_dataframe(experiment)
+    assert spy.call_count == 2
+    assert first is not second
+    assert first["Time / s"].iloc[0] == 0.0
+    assert second["Time / s"].iloc[0] == -1.0
+    assert experiment.results.original not in classes._dataframes
+
+
+def test__get_dataframe__must_return_copies_of_one_dataframe__when_cached(
+    mocker, interleaved_rows
+):
+    experiment = make_experiment(interleaved_rows)
+    spy = mocker.spy(classes, "create_dataframe")
+    first = get_dataframe(experiment, cache=True)
+    first.loc[0, "Time / s"] = -1.0
+    second = get_dataframe(experiment, cache=True)
+    assert spy.call_count == 1
+    assert second["Time / s"].iloc[0] == 0.0
+    pd.testing.assert_frame_equal(second, get_dataframe(experiment))
+
+
+def test__get_dataframe__must_rebuild_cached_dataframe__when_rows_are_added_or_replaced(
+    interleaved_rows,
+):
+    experiment = make_experiment(interleaved_rows)
+    results = experiment.results.original
+    assert len(get_dataframe(experiment, cache=True)) == 8
+    results.rows.append(DataSetRow_Item(**{STEP_COLUMN: STEP_A, TIME_COLUMN: 8.0}))
+    assert len(get_dataframe(experiment, cache=True)) == 9
+    results.rows = [DataSetRow_Item(**row) for row in reversed(interleaved_rows)]
+    results.rows.append(DataSetRow_Item(**{STEP_COLUMN: STEP_A, TIME_COLUMN: 8.0}))
+    df = get_dataframe(experiment, cache=True)
+    assert df["Time / s"].tolist() == [7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0, 0.0, 8.0]
+
+
+def test__get_dataframe__must_pick_up_rows_modified_in_place__when_called_without_cache(
+    interleaved_rows,
+):
+    experiment = make_experiment(interleaved_rows)
+    get_dataframe(experiment, cache=True)
+    experiment.results.original.rows[0].__dict__[TIME_COLUMN] = -1.0
+    # modifications in place are not detected by the cache
+    assert get_dataframe(experiment, cache=True)["Time / s"].iloc[0] == 0.0
+    assert get_dataframe(experiment)["Time / s"].iloc[0] == -1.0
+    assert get_dataframe(experiment, cache=True)["Time / s"].iloc[0] == -1.0
+
+
+def test__get_dataframes_by_step__must_use_experiment_get_dataframe__when_not_cached(
+    interleaved_rows,
+):
+    experiment = make_experiment(interleaved_rows, steps=[STEP_A, STEP_B])
+    build_dataframe = experiment.get_dataframe
+    experiment.get_dataframe = lambda section: build_dataframe(section).iloc[:4]
+    _, frames = get_dataframes_by_step(experiment)
+    assert [list(frame.index) for frame in frames] == [[0, 1], [3]]
+
+
+def test__get_dataframes_by_step__must_reuse_dataframe__when_cached(
+    mocker, interleaved_rows
+):
+    experiment = make_experiment(interleaved_rows, steps=[STEP_A, STEP_B])
+    spy = mocker.spy(classes, "create_dataframe")
+    _, first = get_dataframes_by_step(experiment, cache=True)
+    _, second = get_dataframes_by_step(experiment, cache=True)
+    assert spy.call_count == 1
+    for first_frame, second_frame in zip(first, second):
+        pd.testing.assert_frame_equal(first_frame, second_frame)
+
+
+@pytest.fixture
+def typed_experiment():
+    cycle_column = "1a2b8f1f-f1fd-42a2-9755-d4c13a902931"
+    headers = {
+        STEP_COLUMN: DataSetColumnHeader(
+            display_name="Procedure Step Id", value_type="Uuid"
+        ),
+        TIME_COLUMN: DataSetColumnHeader(
+            display_name="Time", value_type="Number", unit=Unit(name="s")
+        ),
+        NOTE_COLUMN: DataSetColumnHeader(display_name="Note", value_type="Text"),
+        cycle_column: DataSetColumnHeader(display_name="Cycle", value_type="Integer"),
+    }
+    rows = [
+        {STEP_COLUMN: STEP_A, TIME_COLUMN: 0, NOTE_COLUMN: "x", cycle_column: 1},
+        {STEP_COLUMN: STEP_A, TIME_COLUMN: 0.5, cycle_column: 2},
+        {STEP_COLUMN: None, TIME_COLUMN: None, NOTE_COLUMN: None},
+        {STEP_COLUMN: STEP_B, NOTE_COLUMN: "y", cycle_column: 3},
+    ]
+    return make_experiment(rows, headers=headers)
+
+
+def test__create_dataframe__must_use_column_dtypes(typed_experiment):
+    df = create_dataframe(typed_experiment)
+    assert list(df.columns) == ["Procedure Step Id", "Time / s", "Note", "Cycle"]
+    assert df["Time / s"].dtype == np.float64
+    assert df["Procedure Step Id"].dtype == object
+    assert df["Note"].dtype == object
+    assert df["Cycle"].dtype == object
+
+
+def test__create_dataframe__must_read_mixed_integer_and_float_numbers_as_floats(
+    typed_experiment,
+):
+    df = create_dataframe(typed_experiment, end_index=2)
+    assert df["Time / s"].tolist() == [0.0, 0.5]
+    assert df["Time / s"].dtype == np.float64
+
+
+def test__create_dataframe__must_use_nan__when_numbers_are_missing_or_none(
+    typed_experiment,
+):
+    df = create_dataframe(typed_experiment)
+    assert df["Time / s"].iloc[:2].tolist() == [0.0, 0.5]
+    assert df["Time / s"].iloc[2:].isna().all()
+    assert pd.isna(df["Note"].iloc[1])
+    assert pd.isna(df["Cycle"].iloc[2])
+
+
+def test__create_dataframe__must_convert_uuid_columns_to_uuids(typed_experiment):
+    step_ids = create_dataframe(typed_experiment)["Procedure Step Id"].tolist()
+    assert step_ids == [UUID(STEP_A), UUID(STEP_A), None, UUID(STEP_B)]
+    assert all(type(step_id) is UUID for step_id in step_ids if step_id is not None)
+    # each distinct step id is parsed once
+    assert step_ids[0] is step_ids[1]